@@ -0,0 +1,576 @@
+"""
+BRAHAN_SEER ANALYSIS SERVICE v1.0
+Local asyncio HTTP + WebSocket front door to the Python kernels for the dashboard.
+The event loop only parses requests and streams results; every kernel call runs in a
+pool of warm worker processes that import HydraulicFingerprinter, ValveForensics, the
+LAS parser and the basin auditors once at start-up.
+
+HTTP (JSON in; NDJSON chunked out for streaming ops):
+  GET  /                    liveness probe (MissionControl.tsx polls localhost:8000)
+  GET  /metrics             per-op request counts and p50/p99 latency
+  POST /api/fingerprint     {"time": [...], "pressure": [...], "delta_p": 800}           -> echo stream
+  POST /api/valve           {"time": [...], "pressure": [...], "well_id": "D-03"}         -> verdict
+  POST /api/las             {"text": "<LAS>", "curves": "GR,CALI", "rows": true}          -> header + row pages
+  POST /api/ghost-wells     {"basin": [BasinAuditNode...], "text": false}                -> alert stream
+  POST /api/ukcs            {"records": [...], "today": "2026-01-31"}                    -> summary + ghost stream
+WebSocket /ws: send {"id": 1, "op": "<op>", "payload": {...}}; every reply carries the id
+and the final message of each op is {"id": 1, "type": "done"} (or "error").
+
+Browser requests are only served to the dashboard origin (the vite dev server on
+localhost:3000, extend with --allow-origin); any other Origin, including on the /ws
+upgrade, is refused with 403. Requests without an Origin header (curl, CLI) pass.
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import signal
+import struct
+import asyncio
+import hashlib
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(ROOT, "core"), os.path.join(ROOT, "scripts"), ROOT):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import telemetry
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+ROW_PAGE = 1000        # LAS rows per streamed page
+ECHO_PAGE = 256        # echoes per streamed message
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+STATUS_TEXT = {200: "OK", 204: "No Content", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+               405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+DASHBOARD_ORIGINS = ("http://localhost:3000", "http://127.0.0.1:3000")
+CORS_HEADERS = (
+    "Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+    "Access-Control-Allow-Headers: Content-Type\r\n"
+)
+
+
+# ---------------------------------------------------------------- worker side
+# Everything below runs inside the process pool. Kernels are imported and instantiated
+# once per worker by `_warm_worker`; jobs only receive plain payloads.
+
+_kernels = {}
+
+
+def _warm_worker():
+    sys.stdout = open(os.devnull, "w")  # kernels print console banners
+    from hydraulic_fingerprinting import HydraulicFingerprinter
+    from scale_vs_seal_solver import ValveForensics
+    from ghost_well_hunter import GhostWellHunter
+    from ukcs_audit import UKCSBasinAuditor, SuspendedWellsTable
+    import real_las_audit
+    _kernels.update(
+        fingerprinter=HydraulicFingerprinter(),
+        fingerprinter_cls=HydraulicFingerprinter,
+        valve_cls=ValveForensics,
+        hunter=GhostWellHunter(),
+        auditor=UKCSBasinAuditor(),
+        table_cls=SuspendedWellsTable,
+        las=real_las_audit,
+    )
+
+
+def _ping(_=None):
+    return os.getpid()
+
+
+def _plain(value):
+    return value.item() if hasattr(value, "item") else value
+
+
+def _job_fingerprint(payload):
+    import numpy as np
+    if "initial_pressure" in payload or "wave_speed" in payload:
+        fingerprinter = _kernels["fingerprinter_cls"](payload.get("initial_pressure", 2500), payload.get("wave_speed", 1450))
+    else:
+        fingerprinter = _kernels["fingerprinter"]
+    t = np.asarray(payload["time"], dtype=float)
+    p = np.asarray(payload["pressure"], dtype=float)
+    echoes = fingerprinter.extract_echoes(t, p, float(payload.get("delta_p", 800)))
+    return [{key: _plain(value) for key, value in echo.items()} for echo in echoes]
+
+
+def _job_valve(payload):
+    import numpy as np
+    solver = _kernels["valve_cls"](payload.get("well_id", "UNKNOWN_WELL"))
+    if "inhibitor_lapse_days" in payload:
+        solver.inhibitor_lapse_days = payload["inhibitor_lapse_days"]
+    return solver.assess(np.asarray(payload["time"], dtype=float), np.asarray(payload["pressure"], dtype=float))
+
+
+def _job_las(payload):
+    import numpy as np
+    well_name, curves, data = _kernels["las"].parse_las_text(payload["text"])
+    wanted = [c.strip().upper() for c in payload.get("curves", "").split(",") if c.strip()]
+    aliases = {"DEPT": "DEPTH"}
+    selected = [c for c in curves if not wanted or c in wanted or aliases.get(c, c) == "DEPTH"]
+    columns = [curves.index(c) for c in selected]
+    block = data[:, columns] if len(data) else np.empty((0, len(columns)))
+    with np.errstate(invalid="ignore"):
+        stats = {c: {"min": _finite(np.nanmin(block[:, i])) if len(block) else None,
+                     "max": _finite(np.nanmax(block[:, i])) if len(block) else None,
+                     "mean": _finite(np.nanmean(block[:, i])) if len(block) else None,
+                     "null_fraction": float(np.isnan(block[:, i]).mean()) if len(block) else 0.0}
+                 for i, c in enumerate(selected)}
+    header = {"well": well_name, "curves": selected, "samples": int(len(block)), "stats": stats}
+    return header, (block if payload.get("rows") else None)
+
+
+def _finite(value):
+    value = float(value)
+    return value if value == value and abs(value) != float("inf") else None
+
+
+def _job_ghost_chunk(chunk, render_text):
+    hunter = _kernels["hunter"]
+    records = []
+    for record in hunter.stream_alerts(chunk):
+        if render_text:
+            record["alert"] = hunter.render_alert(record)
+        records.append(record)
+    return records
+
+
+def _job_ukcs(payload):
+    import numpy as np
+    auditor = _kernels["auditor"]
+    table = _kernels["table_cls"].from_records(payload["records"])
+    audit = auditor.audit_bulk(table, payload.get("today"))
+    summary = auditor.audit_summary(table, audit)
+    ghosts = [{key: _plain(column[row]) for key, column in audit.items()}
+              for row in np.flatnonzero(audit["is_out_of_consent"])]
+    return summary, ghosts
+
+
+def _basin_chunks(basin):
+    """Splits a BasinAuditNode[] tree into one sub-tree per (region, asset) for parallel hunting."""
+    for node in basin:
+        for asset in node.get("assets", []):
+            yield [{"region": node.get("region"), "assets": [asset]}]
+
+
+def _json_rows(block):
+    """Rows as lists with NaN mapped to null (JSON has no NaN)."""
+    rows = block.tolist()
+    for row in rows:
+        for i, value in enumerate(row):
+            if value != value:
+                row[i] = None
+    return rows
+
+
+# ---------------------------------------------------------------- service side
+
+class AnalysisService:
+    """
+    Dispatches ops to the warm process pool and streams their items back.
+    Each op is an async generator of JSON-ready dicts shared by the HTTP and WebSocket paths.
+    """
+    STREAMING = {"fingerprint", "las", "ghost-wells", "ukcs"}
+
+    def __init__(self, host="127.0.0.1", port=8000, workers=None, max_queued=None, allowed_origins=None):
+        self.host = host
+        self.port = port
+        self.allowed_origins = set(DASHBOARD_ORIGINS) | set(allowed_origins or ())
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.pool = None
+        # Bounds CPU jobs waiting on the pool so a burst cannot queue unbounded payloads
+        self.job_slots = asyncio.Semaphore(max_queued or self.workers * 4)
+        self.started = time.time()
+        self.latency = {}
+        self.requests = {}
+        self.errors = {}
+        self.in_flight = 0
+        self.ops = {
+            "fingerprint": self.op_fingerprint,
+            "valve": self.op_valve,
+            "las": self.op_las,
+            "ghost-wells": self.op_ghost_wells,
+            "ukcs": self.op_ukcs,
+        }
+
+    # -- pool
+
+    def start_pool(self):
+        self.pool = ProcessPoolExecutor(self.workers, initializer=_warm_worker)
+        # Spawn and warm every worker before the first request arrives
+        list(self.pool.map(_ping, range(self.workers * 2)))
+
+    async def _run(self, fn, *args):
+        async with self.job_slots:
+            return await asyncio.get_running_loop().run_in_executor(self.pool, fn, *args)
+
+    # -- ops
+
+    async def op_fingerprint(self, payload):
+        echoes = await self._run(_job_fingerprint, payload)
+        for start in range(0, len(echoes), ECHO_PAGE):
+            yield {"type": "echoes", "offset": start, "echoes": echoes[start:start + ECHO_PAGE]}
+        yield {"type": "summary", "samples": len(payload["pressure"]), "echo_count": len(echoes),
+               "phantom_steel": sum(e["status"] == "PHANTOM_STEEL_DETECTED" for e in echoes)}
+
+    async def op_valve(self, payload):
+        yield {"type": "verdict", **await self._run(_job_valve, payload)}
+
+    async def op_las(self, payload):
+        header, block = await self._run(_job_las, payload)
+        yield {"type": "header", **header}
+        if block is not None:
+            for start in range(0, len(block), ROW_PAGE):
+                yield {"type": "rows", "offset": start, "rows": _json_rows(block[start:start + ROW_PAGE])}
+
+    async def op_ghost_wells(self, payload):
+        render_text = bool(payload.get("text"))
+        jobs = [asyncio.ensure_future(self._run(_job_ghost_chunk, chunk, render_text))
+                for chunk in _basin_chunks(payload["basin"])]
+        total = 0
+        try:
+            # Alerts go out as each sub-tree finishes, not when the whole basin is done
+            for finished in asyncio.as_completed(jobs):
+                records = await finished
+                total += len(records)
+                for record in records:
+                    yield record  # already typed COMPLIANCE_ALERT, as in the JSONL stream
+        finally:
+            for job in jobs:
+                job.cancel()
+        yield {"type": "summary", "alerts": total}
+
+    async def op_ukcs(self, payload):
+        summary, ghosts = await self._run(_job_ukcs, payload)
+        yield {"type": "summary", **summary}
+        for ghost in ghosts:
+            yield {"type": "ghost", **ghost}
+
+    async def execute(self, op, payload):
+        """Runs one op, recording latency and outcome; yields its items."""
+        start = time.perf_counter()
+        self.in_flight += 1
+        failed = False
+        try:
+            with telemetry.span(f"service.{op}"):
+                async for item in self.ops[op](payload):
+                    yield item
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.in_flight -= 1
+            self._observe(op, time.perf_counter() - start, failed)
+
+    def _observe(self, route, elapsed, failed=False):
+        self.requests[route] = self.requests.get(route, 0) + 1
+        if failed:
+            self.errors[route] = self.errors.get(route, 0) + 1
+        self.latency.setdefault(route, deque(maxlen=20_000)).append(elapsed)
+
+    def metrics(self):
+        routes = {}
+        for route, samples in self.latency.items():
+            ordered = sorted(samples)
+            pick = lambda q: round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1e3, 3)
+            routes[route] = {"requests": self.requests[route], "errors": self.errors.get(route, 0),
+                             "p50_ms": pick(0.50), "p99_ms": pick(0.99), "max_ms": round(ordered[-1] * 1e3, 3)}
+        return {"uptime_s": round(time.time() - self.started, 1), "workers": self.workers,
+                "in_flight": self.in_flight, "routes": routes}
+
+    # -- HTTP
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                # Browsers always send Origin cross-site; only the dashboard may drive the kernels
+                origin = headers.get("origin")
+                if origin is not None and origin not in self.allowed_origins:
+                    raise _HTTPError(403, f"origin {origin} not allowed")
+                if headers.get("upgrade", "").lower() == "websocket" and path == "/ws":
+                    await self.websocket(reader, writer, headers)
+                    break
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self.route(method, path, headers, body, writer, origin)
+                if not keep_alive:
+                    break
+        except _HTTPError as e:
+            await _send_json(writer, e.status, {"error": e.message}, keep_alive=False)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def route(self, method, path, headers, body, writer, origin=None):
+        path = path.split("?", 1)[0]
+        if method == "OPTIONS":
+            return await _send(writer, 204, b"", "text/plain", origin=origin)
+        if method == "GET" and path in ("/", "/health"):
+            start = time.perf_counter()
+            await _send_json(writer, 200, {"status": "ONLINE", "service": "BRAHAN_ANALYSIS_SERVICE",
+                                           "ops": sorted(self.ops), "workers": self.workers}, origin=origin)
+            return self._observe("health", time.perf_counter() - start)
+        if method == "GET" and path == "/metrics":
+            return await _send_json(writer, 200, {**self.metrics(), "telemetry": telemetry.summary()}, origin=origin)
+        if not path.startswith("/api/") or path[5:] not in self.ops:
+            return await _send_json(writer, 404, {"error": f"unknown route {path}"}, origin=origin)
+        if method != "POST":
+            return await _send_json(writer, 405, {"error": "use POST"}, origin=origin)
+
+        op = path[5:]
+        try:
+            payload = _decode_payload(op, headers, body)
+        except ValueError as e:
+            return await _send_json(writer, 400, {"error": str(e)}, origin=origin)
+
+        # The status line waits for the first item, so input rejected by a kernel
+        # (ValueError, e.g. a malformed LAS block) is still reported as a 400
+        items = self.execute(op, payload)
+        try:
+            first = await items.__anext__()
+        except StopAsyncIteration:
+            first = None
+        except Exception as e:
+            status = 400 if isinstance(e, ValueError) else 500
+            return await _send_json(writer, status, {"error": f"{type(e).__name__}: {e}"}, origin=origin)
+        if op not in self.STREAMING:
+            async for _ in items:
+                pass
+            return await _send_json(writer, 200, first, origin=origin)
+
+        # Streaming ops: NDJSON over chunked transfer, one flush per item
+        writer.write(_head(200, "application/x-ndjson", chunked=True, origin=origin))
+        try:
+            if first is not None:
+                await _write_chunk(writer, json.dumps(first, default=str).encode() + b"\n")
+            async for item in items:
+                await _write_chunk(writer, json.dumps(item, default=str).encode() + b"\n")
+        except Exception as e:
+            await _write_chunk(writer, json.dumps({"type": "error", "error": f"{type(e).__name__}: {e}"}).encode() + b"\n")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    # -- WebSocket
+
+    async def websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key")
+        if not key:
+            raise _HTTPError(400, "missing Sec-WebSocket-Key")
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+        await writer.drain()
+
+        send_lock = asyncio.Lock()
+        tasks = set()
+
+        async def send(message):
+            async with send_lock:
+                writer.write(_ws_frame(0x1, json.dumps(message, default=str).encode()))
+                await writer.drain()
+
+        async def run_op(message):
+            op_id = message.get("id")
+            try:
+                if message.get("op") not in self.ops:
+                    raise ValueError(f"unknown op {message.get('op')!r}")
+                async for item in self.execute(message["op"], message.get("payload") or {}):
+                    await send({"id": op_id, **item})
+                await send({"id": op_id, "type": "done"})
+            except Exception as e:
+                await send({"id": op_id, "type": "error", "error": f"{type(e).__name__}: {e}"})
+
+        try:
+            while True:
+                opcode, data = await _ws_read_message(reader)
+                if opcode == 0x8:
+                    async with send_lock:
+                        writer.write(_ws_frame(0x8, data[:2]))
+                        await writer.drain()
+                    break
+                if opcode == 0x9:
+                    async with send_lock:
+                        writer.write(_ws_frame(0xA, data))
+                    continue
+                if opcode != 0x1:
+                    continue
+                try:
+                    message = json.loads(data)
+                except ValueError:
+                    await send({"type": "error", "error": "messages must be JSON"})
+                    continue
+                # Ops on one socket run concurrently; replies are matched by id
+                task = asyncio.ensure_future(run_op(message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def serve(self):
+        self.start_pool()
+        server = await asyncio.start_server(self.handle_connection, self.host, self.port, limit=MAX_BODY_BYTES)
+        print(f">>> ANALYSIS_SERVICE_ONLINE: http://{self.host}:{self.port} | ws://{self.host}:{self.port}/ws | "
+              f"{self.workers} warm workers", file=sys.stderr, flush=True)
+        # SIGTERM/SIGINT stop accepting, then shut the pool down so no worker is orphaned
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+            print(">>> ANALYSIS_SERVICE_OFFLINE", file=sys.stderr, flush=True)
+
+
+class _HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+async def _read_request(reader):
+    """Parses one HTTP/1.1 request; returns None on a clean close between requests."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise
+    except asyncio.LimitOverrunError:
+        raise _HTTPError(413, "request head too large")
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+    except ValueError:
+        raise _HTTPError(400, "malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise _HTTPError(400, "malformed Content-Length")
+    if length < 0:
+        raise _HTTPError(400, "negative Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise _HTTPError(413, f"body exceeds {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+
+def _decode_payload(op, headers, body):
+    content_type = headers.get("content-type", "")
+    if op == "las" and not content_type.startswith("application/json"):
+        return {"text": body.decode("utf-8", "replace"), "rows": False}
+    try:
+        payload = json.loads(body or b"{}")
+    except ValueError:
+        raise ValueError("body must be JSON")
+    if not isinstance(payload, dict):
+        raise ValueError("body must be a JSON object")
+    required = {"fingerprint": ("time", "pressure"), "valve": ("time", "pressure"), "las": ("text",),
+                "ghost-wells": ("basin",), "ukcs": ("records",)}[op]
+    missing = [key for key in required if key not in payload]
+    if missing:
+        raise ValueError(f"missing field(s): {', '.join(missing)}")
+    return payload
+
+
+def _head(status, content_type, length=None, chunked=False, keep_alive=True, origin=None):
+    head = f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\nContent-Type: {content_type}\r\nVary: Origin\r\n"
+    if origin:
+        head += f"Access-Control-Allow-Origin: {origin}\r\n{CORS_HEADERS}"
+    head += "Transfer-Encoding: chunked\r\n" if chunked else f"Content-Length: {length or 0}\r\n"
+    if not keep_alive:
+        head += "Connection: close\r\n"
+    return (head + "\r\n").encode()
+
+
+async def _send(writer, status, body, content_type, keep_alive=True, origin=None):
+    writer.write(_head(status, content_type, len(body), keep_alive=keep_alive, origin=origin) + body)
+    await writer.drain()
+
+
+async def _send_json(writer, status, obj, keep_alive=True, origin=None):
+    await _send(writer, status, json.dumps(obj, default=str).encode(), "application/json", keep_alive, origin)
+
+
+async def _write_chunk(writer, data):
+    writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+    await writer.drain()
+
+
+def _ws_frame(opcode, payload):
+    n = len(payload)
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return header + payload
+
+
+async def _ws_read_message(reader):
+    """Reads one (possibly fragmented) message; control frames are returned as they arrive."""
+    opcode, chunks = None, []
+    while True:
+        b1, b2 = await reader.readexactly(2)
+        frame_op, fin = b1 & 0x0F, b1 & 0x80
+        n = b2 & 0x7F
+        if n == 126:
+            n = struct.unpack("!H", await reader.readexactly(2))[0]
+        elif n == 127:
+            n = struct.unpack("!Q", await reader.readexactly(8))[0]
+        if n > MAX_BODY_BYTES:
+            raise ConnectionError("websocket frame too large")
+        mask = await reader.readexactly(4) if b2 & 0x80 else None
+        data = await reader.readexactly(n)
+        if mask:
+            data = bytes(b ^ mask[i % 4] for i, b in enumerate(data)) if n < 4096 else _unmask(data, mask)
+        if frame_op >= 0x8:
+            return frame_op, data
+        if frame_op != 0x0:
+            opcode = frame_op
+        chunks.append(data)
+        if fin:
+            return opcode, b"".join(chunks)
+
+
+def _unmask(data, mask):
+    import numpy as np
+    n = len(data)
+    key = np.frombuffer((mask * (n // 4 + 1))[:n], dtype=np.uint8)
+    return (np.frombuffer(data, dtype=np.uint8) ^ key).tobytes()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Brahan local analysis service (HTTP + WebSocket)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, help="Kernel worker processes (default: CPUs - 1)")
+    parser.add_argument("--allow-origin", action="append", default=[],
+                        help=f"Extra browser origin to serve besides {', '.join(DASHBOARD_ORIGINS)} (repeatable)")
+    args = parser.parse_args(argv)
+    asyncio.run(AnalysisService(args.host, args.port, args.workers, allowed_origins=args.allow_origin).serve())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
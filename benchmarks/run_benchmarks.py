@@ -0,0 +1,227 @@
+"""
+BRAHAN_SEER BENCHMARK SUITE: KERNEL_TIMING v1.0
+Times the Python kernels at several data sizes on seeded synthetic data, writes a JSON
+baseline, and compares a run against a stored baseline to flag regressions.
+
+Usage:
+  python benchmarks/run_benchmarks.py --save benchmarks/baseline.json
+  python benchmarks/run_benchmarks.py --compare benchmarks/baseline.json --threshold 0.25
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import types
+import platform
+import argparse
+import contextlib
+from datetime import datetime, timezone
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "core"), os.path.join(ROOT, "scripts"), os.path.dirname(os.path.abspath(__file__))):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import synthetic_data as synth
+
+SIZES = {
+    "quick": (1_000, 10_000),
+    "full": (1_000, 10_000, 100_000),
+}
+
+
+@contextlib.contextmanager
+def compute_only(*modules):
+    """
+    Silences console banners and turns the kernels' simulated-latency time.sleep calls
+    into no-ops for the duration of a measurement, so only real compute is timed.
+    """
+    saved = []
+    for module in modules:
+        real_time = getattr(module, "time", None)
+        if real_time is None:
+            continue
+        shim = types.SimpleNamespace(**{name: getattr(real_time, name) for name in dir(real_time) if not name.startswith("_")})
+        shim.sleep = lambda seconds: None
+        saved.append((module, real_time))
+        module.time = shim
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        for module, real_time in saved:
+            module.time = real_time
+
+
+def measure(fn, repeat, warmup=1):
+    """Runs `fn` warmup + repeat times and returns timing statistics in seconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples = np.array(samples)
+    return {"min": float(samples.min()), "median": float(np.median(samples)),
+            "mean": float(samples.mean()), "repeat": repeat}
+
+
+def build_cases(sizes, seed):
+    """Yields (name, n, setup) where setup() returns (fn, modules) ready to time."""
+    import hydraulic_fingerprinting
+    import scale_vs_seal_solver
+    import ddr_forensic_scraper
+    import real_las_audit
+    import ghost_well_hunter
+    import ukcs_audit
+    import chanonry_protocol
+    from well_registry import WellRegistry
+
+    for n in sizes:
+        def kalman(n=n):
+            _, raw, _ = synth.pressure_decay_with_echoes(n, seed)
+            fp = hydraulic_fingerprinting.HydraulicFingerprinter()
+            return (lambda: fp.apply_kalman_filter(raw)), (hydraulic_fingerprinting,)
+        yield "apply_kalman_filter", n, kalman
+
+        def process_signal(n=n):
+            t, raw, delta_p = synth.pressure_decay_with_echoes(n, seed)
+            fp = hydraulic_fingerprinting.HydraulicFingerprinter()
+            return (lambda: fp.process_signal(t, raw, delta_p)), (hydraulic_fingerprinting,)
+        yield "process_signal", n, process_signal
+
+        def decay_pattern(n=n):
+            t, p = synth.valve_ratchet_series(n, seed)
+            solver = scale_vs_seal_solver.ValveForensics("BENCH")
+            return (lambda: solver.analyze_decay_pattern(t, p)), (scale_vs_seal_solver,)
+        yield "analyze_decay_pattern", n, decay_pattern
+
+        def entropy(n=n):
+            gr = synth.gr_curve(n, seed)
+            scraper = ddr_forensic_scraper.DDRForensicScraper()
+            return (lambda: scraper.calculate_entropy(gr)), (ddr_forensic_scraper,)
+        yield "calculate_entropy", n, entropy
+
+        def las_parse(n=n):
+            path = synth.write_las_file(synth.scratch_path(f"bench_{n}_{seed}.las"), n, seed)
+            return (lambda: real_las_audit.parse_las(path)), (real_las_audit,)
+        yield "parse_las", n, las_parse
+
+        def compliance_per_record(n=n):
+            tree = synth.basin_tree(n, seed)
+            hunter = ghost_well_hunter.GhostWellHunter()
+            wells = [w for r in tree for a in r["assets"] for p in a["riskProfiles"] for w in p["wells"]]
+            return (lambda: [hunter.evaluate_compliance(w) for w in wells]), (ghost_well_hunter,)
+        yield "evaluate_compliance[per_record]", n, compliance_per_record
+
+        # Same rows as [per_record]; the one-off index build is timed separately below
+        def compliance_registry(n=n):
+            registry = WellRegistry.from_basin_data(synth.basin_tree(n, seed))
+            return (lambda: registry.violation_codes()), ()
+        yield "evaluate_compliance[registry]", n, compliance_registry
+
+        def registry_build(n=n):
+            tree = synth.basin_tree(n, seed)
+            return (lambda: WellRegistry.from_basin_data(tree)), ()
+        yield "well_registry_build", n, registry_build
+
+        def basin_audit(n=n):
+            table = ukcs_audit.SuspendedWellsTable.from_records(synth.suspended_wells_records(n, seed))
+            auditor = ukcs_audit.UKCSBasinAuditor()
+            return (lambda: auditor.audit_bulk(table, "2026-01-01")), (ukcs_audit,)
+        yield "audit_bulk", n, basin_audit
+
+        def sara(n=n):
+            table = synth.sara_table(n, seed)
+            return (lambda: chanonry_protocol.screen_sara_batch(**table)), ()
+        yield "screen_sara_batch", n, sara
+
+
+def run_suite(sizes, repeat, seed, only=None):
+    results = {}
+    for name, n, setup in build_cases(sizes, seed):
+        if only and not any(token in name for token in only):
+            continue
+        fn, modules = setup()
+        with compute_only(*modules):
+            stats = measure(fn, repeat)
+        stats["n"] = n
+        stats["throughput_per_s"] = n / stats["median"] if stats["median"] > 0 else None
+        key = f"{name}[n={n}]"
+        results[key] = stats
+        print(f"{key:<48} median {stats['median'] * 1e3:>10.3f} ms   {stats['throughput_per_s'] or 0:>14,.0f} samples/s")
+    return results
+
+
+def compare(current, baseline, threshold):
+    """Returns (regressions, improvements) where median time moved by more than `threshold`."""
+    regressions, improvements = [], []
+    for key, stats in current.items():
+        ref = baseline.get(key)
+        if not ref or not ref.get("median"):
+            continue
+        ratio = stats["median"] / ref["median"]
+        if ratio > 1 + threshold:
+            regressions.append((key, ref["median"], stats["median"], ratio))
+        elif ratio < 1 - threshold:
+            improvements.append((key, ref["median"], stats["median"], ratio))
+    return regressions, improvements
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Brahan Python kernel benchmarks")
+    parser.add_argument("--profile", choices=sorted(SIZES), default="quick", help="Data-size ladder")
+    parser.add_argument("--sizes", type=str, help="Comma-separated sizes overriding --profile")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", type=str, help="Comma-separated substrings of kernel names to run")
+    parser.add_argument("--save", type=str, help="Write results as a JSON baseline")
+    parser.add_argument("--compare", type=str, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Relative slowdown that counts as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = tuple(int(s) for s in args.sizes.split(",")) if args.sizes else SIZES[args.profile]
+    only = args.only.split(",") if args.only else None
+
+    print(">>> INITIATING KERNEL BENCHMARK SUITE")
+    print(f">>> SIZES: {sizes} | REPEAT: {args.repeat} | SEED: {args.seed}")
+    results = run_suite(sizes, args.repeat, args.seed, only)
+
+    document = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(document, f, indent=2)
+        print(f">>> BASELINE_COMMITTED: {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        regressions, improvements = compare(results, baseline, args.threshold)
+        for key, before, after, ratio in improvements:
+            print(f"[+] FASTER  {key}: {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms (x{ratio:.2f})")
+        for key, before, after, ratio in regressions:
+            print(f"[!] REGRESSION {key}: {before * 1e3:.3f} ms -> {after * 1e3:.3f} ms (x{ratio:.2f})")
+        if regressions:
+            print(f">>> {len(regressions)} REGRESSION(S) BEYOND {args.threshold:.0%}")
+            return 1
+        print(">>> NO REGRESSIONS DETECTED")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
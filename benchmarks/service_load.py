@@ -0,0 +1,201 @@
+"""
+BRAHAN_SEER BENCHMARK SUITE: SERVICE_LOAD v1.0
+Concurrent dashboard load against analysis_service.py: N keep-alive clients issue a weighted
+mix of liveness polls, valve verdicts, echo extractions, LAS headers and ghost-well hunts
+for a fixed duration, then report requests/sec and p50/p95/p99 latency per op.
+
+Usage:
+  python benchmarks/service_load.py --spawn --concurrency 32 --duration 10
+  python benchmarks/service_load.py --host 127.0.0.1 --port 8000 --save load.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import argparse
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import synthetic_data as synth
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (op, weight): roughly what an open dashboard generates
+DASHBOARD_MIX = (
+    ("health", 30),
+    ("valve", 25),
+    ("fingerprint", 20),
+    ("las", 15),
+    ("ghost-wells", 10),
+)
+
+
+def build_payloads(seed):
+    t, p = synth.valve_ratchet_series(300, seed)
+    t_fp, raw, delta_p = synth.pressure_decay_with_echoes(1000, seed)
+    las_path = synth.write_las_file(synth.scratch_path(f"service_{seed}.las"), 2000, seed)
+    with open(las_path) as f:
+        las_text = f.read()
+    return {
+        "valve": ("POST", "/api/valve", {"time": t.tolist(), "pressure": p.tolist(), "well_id": "D-03"}),
+        "fingerprint": ("POST", "/api/fingerprint", {"time": t_fp.tolist(), "pressure": raw.tolist(), "delta_p": delta_p}),
+        "las": ("POST", "/api/las", {"text": las_text, "curves": "GR,CALI"}),
+        "ghost-wells": ("POST", "/api/ghost-wells", {"basin": synth.basin_tree(200, seed)}),
+        "health": ("GET", "/", None),
+    }
+
+
+def encode_requests(payloads, host):
+    encoded = {}
+    for op, (method, path, body) in payloads.items():
+        data = json.dumps(body).encode() if body is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\nContent-Length: {len(data)}\r\n\r\n"
+        encoded[op] = head.encode() + data
+    return encoded
+
+
+async def read_response(reader):
+    """Reads one full response (Content-Length or chunked); returns the status code."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {k.strip().lower(): v.strip() for k, _, v in (l.partition(":") for l in lines[1:] if l)}
+    if headers.get("transfer-encoding") == "chunked":
+        while True:
+            size = int((await reader.readuntil(b"\r\n"))[:-2], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get("content-length", 0)))
+    return status
+
+
+async def client(host, port, requests, ops, weights, deadline, samples, errors, rng):
+    reader, writer = await asyncio.open_connection(host, port, limit=64 * 1024 * 1024)
+    try:
+        while time.perf_counter() < deadline:
+            op = rng.choices(ops, weights)[0]
+            start = time.perf_counter()
+            writer.write(requests[op])
+            await writer.drain()
+            status = await read_response(reader)
+            elapsed = time.perf_counter() - start
+            samples.append((op, elapsed))
+            if status != 200:
+                errors[op] = errors.get(op, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run_load(host, port, concurrency, duration, seed):
+    payloads = build_payloads(seed)
+    requests = encode_requests(payloads, host)
+    ops = [op for op, _ in DASHBOARD_MIX]
+    weights = [w for _, w in DASHBOARD_MIX]
+    samples, errors = [], {}
+
+    # Short warm-up so first-touch costs are not counted
+    warm_deadline = time.perf_counter() + min(1.0, duration / 5)
+    await asyncio.gather(*(client(host, port, requests, ops, weights, warm_deadline, [], {}, random.Random(i))
+                           for i in range(min(concurrency, 4))))
+
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(client(host, port, requests, ops, weights, deadline, samples, errors, random.Random(seed + i))
+                           for i in range(concurrency)))
+    wall = time.perf_counter() - start
+    return summarize(samples, errors, wall, concurrency)
+
+
+def _percentiles(latencies):
+    values = np.array(latencies) * 1e3
+    return {"p50_ms": float(np.percentile(values, 50)), "p95_ms": float(np.percentile(values, 95)),
+            "p99_ms": float(np.percentile(values, 99)), "max_ms": float(values.max())}
+
+
+def summarize(samples, errors, wall, concurrency):
+    by_op = {}
+    for op, elapsed in samples:
+        by_op.setdefault(op, []).append(elapsed)
+    return {
+        "concurrency": concurrency,
+        "duration_s": wall,
+        "requests": len(samples),
+        "requests_per_s": len(samples) / wall,
+        "errors": errors,
+        **_percentiles([elapsed for _, elapsed in samples]),
+        "ops": {op: {"requests": len(values), "requests_per_s": len(values) / wall, **_percentiles(values)}
+                for op, values in sorted(by_op.items())},
+    }
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def spawn_service(port, workers):
+    cmd = [sys.executable, os.path.join(ROOT, "analysis_service.py"), "--port", str(port)]
+    if workers:
+        cmd += ["--workers", str(workers)]
+    process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    # The service announces itself on stderr once its workers are warm
+    line = process.stderr.readline()
+    if "ANALYSIS_SERVICE_ONLINE" not in line:
+        process.kill()
+        raise RuntimeError(f"service failed to start: {line.strip()}")
+    return process
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent dashboard load against the analysis service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--spawn", action="store_true", help="Start a private service instance on a free port")
+    parser.add_argument("--workers", type=int, help="Worker processes for --spawn")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", type=str, help="Write the report as JSON")
+    args = parser.parse_args(argv)
+
+    process = None
+    if args.spawn:
+        args.port = _free_port()
+        process = spawn_service(args.port, args.workers)
+    try:
+        print(f">>> INITIATING SERVICE LOAD: {args.concurrency} clients x {args.duration:.0f}s -> {args.host}:{args.port}")
+        report = asyncio.run(run_load(args.host, args.port, args.concurrency, args.duration, args.seed))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    print(f">>> THROUGHPUT: {report['requests_per_s']:,.1f} req/s over {report['requests']:,} requests")
+    print(f">>> LATENCY: p50 {report['p50_ms']:.2f} ms | p95 {report['p95_ms']:.2f} ms | p99 {report['p99_ms']:.2f} ms")
+    for op, stats in report["ops"].items():
+        print(f"  {op:<12} {stats['requests_per_s']:>9,.1f} req/s   p50 {stats['p50_ms']:>8.2f} ms   p99 {stats['p99_ms']:>8.2f} ms")
+    if report["errors"]:
+        print(f"[!] NON_200_RESPONSES: {report['errors']}")
+
+    if args.save:
+        report["meta"] = {"timestamp": datetime.now(timezone.utc).isoformat(), "python": platform.python_version(),
+                          "platform": platform.platform(), "cpus": os.cpu_count(), "seed": args.seed}
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f">>> REPORT_COMMITTED: {args.save}")
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
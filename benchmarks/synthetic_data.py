@@ -0,0 +1,133 @@
+"""
+BRAHAN_SEER BENCHMARK SUITE: SYNTHETIC_DATA v1.0
+Seeded generators for every Python kernel's input shape.
+Same seed + same size -> byte-identical data, so timings are comparable run to run.
+"""
+
+import os
+
+import numpy as np
+
+OPERATORS = ("EnQuest Heather Ltd", "CNOOC Petroleum Europe", "Ithaca Energy", "Serica Energy", "Harbour Energy")
+FLUIDS = ("15% HCl Acid", "Diesel", "Xylene", "HF Mud Acid", "Brine")
+
+
+def pressure_decay_with_echoes(n, seed=0, initial_pressure=2500, delta_p=800, tau=4.5, echoes=3, noise=15.0):
+    """Noisy exponential decay with hidden reflection pulses (HydraulicFingerprinter.run_audit)."""
+    rng = np.random.default_rng(seed)
+    t = np.linspace(0, 10, n)
+    signal = initial_pressure + delta_p * np.exp(-t / tau)
+    for idx in rng.choice(np.arange(n // 10, n - 1), size=min(echoes, max(n - 2, 0)), replace=False):
+        signal[idx] += 45.0
+    return t, signal + rng.normal(0, noise, n), delta_p
+
+
+def valve_ratchet_series(n, seed=0, p_start=3000.0):
+    """Stutter/hold/snap pressure series (ValveForensics.analyze_decay_pattern)."""
+    rng = np.random.default_rng(seed)
+    steps = rng.choice([0.0, -5.0, -25.0, -60.0], size=n - 1, p=[0.35, 0.3, 0.25, 0.1])
+    steps += rng.normal(0, 3.0, n - 1) * (steps != 0)
+    pressure = np.concatenate(([p_start], p_start + np.cumsum(steps)))
+    return np.arange(n, dtype=float), pressure
+
+
+def gr_curve(n, seed=0, smoothed_fraction=0.2):
+    """Gamma-ray trace with copy-pasted flat runs standing in for 'smoothed' intervals."""
+    rng = np.random.default_rng(seed)
+    gr = 60 + 40 * np.sin(np.linspace(0, 30, n)) + rng.normal(0, 8, n)
+    flat = int(n * smoothed_fraction)
+    if flat:
+        start = rng.integers(0, n - flat + 1)
+        gr[start:start + flat] = gr[start]
+    return np.round(gr, 2)
+
+
+def write_las_file(path, n, seed=0, well_name="NC-12", null_value=-999.25):
+    """Writes a LAS 2.0 file with DEPT, GR, CALI, BS and NPHI curves."""
+    rng = np.random.default_rng(seed)
+    depth = 1500.0 + 0.1524 * np.arange(n)
+    gr = gr_curve(n, seed, smoothed_fraction=0.0)
+    cali = 8.5 + rng.normal(0, 0.2, n)
+    bs = np.full(n, 8.5)
+    nphi = np.clip(rng.normal(0.25, 0.05, n), 0, 0.6)
+    data = np.column_stack((depth, gr, cali, bs, nphi))
+    data[rng.random(n) < 0.01, 1] = null_value
+
+    with open(path, "w") as f:
+        f.write("~VERSION INFORMATION\n VERS.   2.0 : CWLS LOG ASCII STANDARD -VERSION 2.0\n WRAP.   NO : ONE LINE PER DEPTH STEP\n")
+        f.write(f"~WELL INFORMATION\n STRT.M   {depth[0]:.4f} :\n STOP.M   {depth[-1]:.4f} :\n NULL.   {null_value} :\n WELL.   {well_name} : WELL\n")
+        f.write("~CURVE INFORMATION\n DEPT.M : DEPTH\n GR  .GAPI : GAMMA RAY\n CALI.IN : CALIPER\n BS  .IN : BIT SIZE\n NPHI.V/V : NEUTRON POROSITY\n")
+        f.write("~ASCII\n")
+        np.savetxt(f, data, fmt="%.4f")
+    return path
+
+
+def basin_tree(wells, seed=0, regions=("Northern North Sea", "Central North Sea", "Southern North Sea")):
+    """Nested BasinAuditNode[] tree as consumed by GhostWellHunter.run_mission."""
+    rng = np.random.default_rng(seed)
+    assets = ("Platform-Based", "Subsea Ghost")
+    profiles = ("ARREARS_CRITICAL", "SUSPENDED_EXTENDED", "ORPHAN_ASSET")
+    tree = [{"region": r, "assets": [{"type": a, "riskProfiles": [{"profile": p, "wells": []} for p in profiles]}
+                                     for a in assets]} for r in regions]
+    region_idx = rng.integers(0, len(regions), wells)
+    asset_idx = rng.integers(0, len(assets), wells)
+    profile_idx = rng.integers(0, len(profiles), wells)
+    missing_expiry = rng.random(wells) < 0.2
+    missing_datum = rng.random(wells) < 0.15
+    arrears = rng.integers(0, 2000, wells)
+    for i in range(wells):
+        profile = profiles[profile_idx[i]]
+        tree[region_idx[i]]["assets"][asset_idx[i]]["riskProfiles"][profile_idx[i]]["wells"].append({
+            "uwi": f"{region_idx[i]}/{asset_idx[i]}-W{i}",
+            "operator": OPERATORS[i % len(OPERATORS)],
+            "assetType": assets[asset_idx[i]],
+            "riskProfile": profile,
+            "status": "Suspended",
+            "suspensionExpiry": None if missing_expiry[i] else "2021-06-30",
+            "lastIntegrityCheck": "2019-11-04",
+            "verticalDatum": None if missing_datum[i] else "MSL",
+            "arrearsDays": int(arrears[i]),
+            "technicalRisk": "Synthetic",
+            "isArrearsCritical": profile == "ARREARS_CRITICAL",
+        })
+    return tree
+
+
+def suspended_wells_records(wells, seed=0):
+    """NSTA suspended-wells export rows (UKCSBasinAuditor bulk audit input)."""
+    rng = np.random.default_rng(seed)
+    days = rng.integers(0, 365 * 10, wells)
+    expiry = (np.datetime64("2018-01-01") + days.astype("timedelta64[D]")).astype(str)
+    missing = rng.random(wells) < 0.01
+    return [{"uwi": f"W{i}", "operator": OPERATORS[i % len(OPERATORS)], "status": "Suspended",
+             "suspension_expiry": None if missing[i] else expiry[i]} for i in range(wells)]
+
+
+def write_suspended_wells_csv(path, wells, seed=0):
+    import csv
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["WELLREGNO", "OPERATOR", "STATUS", "SUSPENSION_EXPIRY"])
+        for r in suspended_wells_records(wells, seed):
+            writer.writerow([r["uwi"], r["operator"], r["status"], r["suspension_expiry"] or ""])
+    return path
+
+
+def sara_table(samples, seed=0):
+    """SARA fractions (summing to 100%), treatment fluid and BHP per sample."""
+    rng = np.random.default_rng(seed)
+    fractions = rng.dirichlet((4, 3, 2.5, 1), samples) * 100
+    return {
+        "saturates": fractions[:, 0],
+        "aromatics": fractions[:, 1],
+        "resins": fractions[:, 2],
+        "asphaltenes": fractions[:, 3],
+        "treatment_fluid": np.array(FLUIDS)[rng.integers(0, len(FLUIDS), samples)],
+        "pressure": rng.uniform(2000, 6000, samples),
+    }
+
+
+def scratch_path(name):
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".scratch")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, name)
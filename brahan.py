@@ -0,0 +1,413 @@
+"""
+BRAHAN_SEER COMMAND SURFACE: UNIFIED_CLI v1.0
+One entry point for every Python kernel. Subcommands import their kernels only when run,
+so `brahan.py --help` and light audits never pay for numpy/requests they do not use.
+
+Warm worker mode:
+  python brahan.py serve &            # preloads numpy + kernels behind a Unix socket
+  python brahan.py las NC-12.las      # forwarded to the worker while it is running
+Each forwarded command runs in a fork of the warm worker, so it starts with every kernel
+already imported and cannot leak state into the next command.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import stat
+import struct
+import socket
+import argparse
+import importlib
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for _path in (os.path.join(ROOT, "core"), os.path.join(ROOT, "scripts"), ROOT):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+# The socket lives in a per-user 0700 directory; a predictable path directly under /tmp could be
+# pre-created by another local user to capture forwarded commands and their stdin.
+DEFAULT_SOCKET = os.environ.get("BRAHAN_WORKER_SOCKET") or os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or "/tmp", f"brahan-{os.getuid()}", "worker.sock")
+
+# Imported once by `serve`; forked children inherit them already initialised.
+WARM_MODULES = (
+    "numpy", "telemetry", "hydraulic_fingerprinting", "scale_vs_seal_solver", "annulus_sawtooth_solver",
+    "ddr_forensic_scraper", "ghost_well_hunter", "well_registry", "ukcs_audit", "ukcs_snapshot",
+    "real_las_audit", "chanonry_protocol",
+)
+
+# Worker wire format: one JSON request line, then frames of tag (1 byte) + length (4 bytes) + payload.
+FRAME_STDOUT, FRAME_STDERR, FRAME_EXIT = b"O", b"E", b"X"
+_HEADER = struct.Struct("!cI")
+
+
+def _open_input(path):
+    return sys.stdin if path == "-" else open(path)
+
+
+def _load_series(path):
+    """Two-column time,pressure CSV (header row skipped)."""
+    import numpy as np
+    with _open_input(path) as f:
+        data = np.loadtxt(f, delimiter=",", skiprows=1, usecols=(0, 1), ndmin=2)
+    return data[:, 0], data[:, 1]
+
+
+# ---------------------------------------------------------------- subcommands
+
+def cmd_ghost_wells(args):
+    from ghost_well_hunter import GhostWellHunter
+    with _open_input(args.basin) as f:
+        basin = json.load(f)
+    hunter = GhostWellHunter()
+    if args.out == "-":
+        hunter.write_alert_stream(basin, sys.stdout, args.text)
+    else:
+        with open(args.out, "w") as out:
+            written = hunter.write_alert_stream(basin, out, args.text)
+        print(f">>> ALERT_STREAM_COMMITTED: {written} records -> {args.out}", file=sys.stderr)
+
+
+def cmd_ukcs(args):
+    from ukcs_audit import UKCSBasinAuditor
+    auditor = UKCSBasinAuditor()
+    if args.snapshot and args.registry:
+        from ukcs_snapshot import IncrementalBasinAudit
+        print(json.dumps(IncrementalBasinAudit(args.snapshot, auditor).run(args.registry), indent=2))
+    elif args.json and args.registry:
+        print(json.dumps(auditor.run_bulk_audit(args.registry), indent=2))
+    else:
+        auditor.run_full_basin_audit(args.registry)
+
+
+def cmd_las(args):
+    from real_las_audit import audit_las_file
+    audit_las_file(args.input, args.out, args.curves)
+
+
+def cmd_chanonry(args):
+    from chanonry_protocol import screen_sara_batch, load_sara_csv, write_screening_csv
+    table = screen_sara_batch(**load_sara_csv(args.csv))
+    if args.out:
+        with open(args.out, "w", newline="") as out:
+            write_screening_csv(table, out)
+    else:
+        write_screening_csv(table, sys.stdout)
+    print(f">>> SCREENED: {len(table['cii'])} samples | UNSTABLE: {int(table['is_unstable'].sum())} | VETO: {int(table['veto'].sum())}",
+          file=sys.stderr)
+
+
+def cmd_fingerprint(args):
+    from hydraulic_fingerprinting import HydraulicFingerprinter
+    fingerprinter = HydraulicFingerprinter(args.initial_pressure, args.wave_speed)
+    if not args.csv:
+        fingerprinter.run_audit()
+        return
+    t, p = _load_series(args.csv)
+    echoes = fingerprinter.process_signal(t, p, args.delta_p)
+    for echo in echoes:
+        print(json.dumps({key: value.item() if hasattr(value, "item") else value for key, value in echo.items()}))
+
+
+def cmd_valve(args):
+    from scale_vs_seal_solver import ValveForensics
+    t, p = _load_series(args.csv)
+    ValveForensics(args.well).generate_verdict(t, p)
+
+
+def cmd_sawtooth(args):
+    from annulus_sawtooth_solver import AnnulusFleetAnalyzer
+    AnnulusFleetAnalyzer(max_lag=args.max_lag).run_audit(args.wells, args.samples)
+
+
+def cmd_mission(args):
+    from multi_agent_framework import AuditOrchestrator
+    vault = None
+    if args.vault:
+        from mission_vault import MissionVault
+        vault = MissionVault(args.vault)
+    orchestrator = AuditOrchestrator(vault=vault)
+    if args.concurrent:
+        orchestrator.run_mission_concurrent(args.goal)
+    else:
+        orchestrator.run_mission(args.goal)
+
+
+def cmd_service(args):
+    import analysis_service
+    argv = ["--host", args.host, "--port", str(args.port)] + (["--workers", str(args.workers)] if args.workers else [])
+    for origin in args.allow_origin:
+        argv += ["--allow-origin", origin]
+    analysis_service.main(argv)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="brahan", description="Brahan Seer forensic kernels")
+    parser.add_argument("--local", action="store_true", help="Never forward to a running warm worker")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="Warm worker socket path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("ghost-wells", help="Streaming JSONL compliance alerts for a basin tree")
+    p.add_argument("basin", help="Basin audit JSON (BasinAuditNode[]), or - for stdin")
+    p.add_argument("--out", default="-", help="JSONL output path, or - for stdout")
+    p.add_argument("--text", action="store_true", help="Include the rendered alert text")
+    p.set_defaults(handler=cmd_ghost_wells)
+
+    p = sub.add_parser("ukcs", help="UKCS suspended-wells consent audit")
+    p.add_argument("--registry", help="NSTA suspended-wells CSV/GeoJSON export")
+    p.add_argument("--snapshot", help="Snapshot file for incremental (diff-only) runs")
+    p.add_argument("--json", action="store_true", help="Print the bulk-audit summary as JSON")
+    p.set_defaults(handler=cmd_ukcs)
+
+    p = sub.add_parser("las", help="Extract curves from a LAS artifact")
+    p.add_argument("input", help="Path to LAS artifact")
+    p.add_argument("--curves", default="GR,CALI", help="Curves to extract")
+    p.add_argument("--out", help="Output CSV path")
+    p.set_defaults(handler=cmd_las)
+
+    p = sub.add_parser("chanonry", help="Batch SARA asphaltene-stability screening")
+    p.add_argument("csv", help="SARA sample table")
+    p.add_argument("--out", help="Screening table output path (default: stdout)")
+    p.set_defaults(handler=cmd_chanonry)
+
+    p = sub.add_parser("fingerprint", help="Hydraulic echo extraction (demo run without --csv)")
+    p.add_argument("--csv", help="time,pressure CSV, or - for stdin")
+    p.add_argument("--delta-p", type=float, default=800.0)
+    p.add_argument("--initial-pressure", type=float, default=2500.0)
+    p.add_argument("--wave-speed", type=float, default=1450.0)
+    p.set_defaults(handler=cmd_fingerprint)
+
+    p = sub.add_parser("valve", help="Scale-vs-seal verdict for a pressure decay series")
+    p.add_argument("csv", help="time,pressure CSV, or - for stdin")
+    p.add_argument("--well", default="UNKNOWN_WELL")
+    p.set_defaults(handler=cmd_valve)
+
+    p = sub.add_parser("sawtooth", help="Simulated annulus sawtooth fleet audit")
+    p.add_argument("--wells", type=int, default=5000)
+    p.add_argument("--samples", type=int, default=288)
+    p.add_argument("--max-lag", type=int, default=72)
+    p.set_defaults(handler=cmd_sawtooth)
+
+    p = sub.add_parser("mission", help="Multi-agent audit mission")
+    p.add_argument("goal")
+    p.add_argument("--concurrent", action="store_true")
+    p.add_argument("--vault", help="Mission vault path for resumable runs")
+    p.set_defaults(handler=cmd_mission)
+
+    p = sub.add_parser("service", help="Run the HTTP/WebSocket analysis service for the dashboard")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8000)
+    p.add_argument("--workers", type=int)
+    p.add_argument("--allow-origin", action="append", default=[], help="Extra browser origin to serve (repeatable)")
+    p.set_defaults(handler=cmd_service)
+
+    p = sub.add_parser("serve", help="Run the warm worker in the foreground")
+    p.set_defaults(handler=None)
+    p = sub.add_parser("ping", help="Report warm worker status")
+    p.set_defaults(handler=None)
+    p = sub.add_parser("stop", help="Shut down the warm worker")
+    p.set_defaults(handler=None)
+    return parser
+
+
+def run_command(argv):
+    """Parses and runs one subcommand in this process; returns the exit code."""
+    import telemetry
+    try:
+        # argparse reports bad arguments by raising SystemExit(2)
+        args = build_parser().parse_args(argv)
+        with telemetry.span(f"cli.{args.command}"):
+            args.handler(args)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    return 0
+
+
+# ---------------------------------------------------------------- warm worker
+
+class _FramedStream:
+    """File-like object forwarding writes to the client as tagged frames."""
+    def __init__(self, conn, tag):
+        self.conn = conn
+        self.tag = tag
+
+    def write(self, text):
+        if text:
+            payload = text.encode()
+            self.conn.sendall(_HEADER.pack(self.tag, len(payload)) + payload)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def serve(socket_path=DEFAULT_SOCKET):
+    import signal
+    import socketserver
+
+    started = time.time()
+    for name in WARM_MODULES:
+        importlib.import_module(name)
+    warm_s = time.time() - started
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            # Runs in a freshly forked child of the warm worker
+            request = json.loads(self.rfile.readline())
+            argv = request.get("argv", [])
+            out, err = _FramedStream(self.connection, FRAME_STDOUT), _FramedStream(self.connection, FRAME_STDERR)
+            code = 1
+            try:
+                if argv[:1] == ["ping"]:
+                    out.write(json.dumps({"pid": os.getppid(), "uptime_s": round(time.time() - started, 1),
+                                          "warmup_s": round(warm_s, 3), "modules": list(WARM_MODULES)}) + "\n")
+                    code = 0
+                elif argv[:1] == ["stop"]:
+                    out.write(">>> WORKER_SHUTDOWN\n")
+                    os.kill(os.getppid(), signal.SIGTERM)
+                    code = 0
+                else:
+                    os.chdir(request.get("cwd", os.getcwd()))
+                    sys.stdin = io.StringIO(request.get("stdin", ""))
+                    sys.stdout, sys.stderr = out, err
+                    code = run_command(argv)
+            except BaseException as e:
+                err.write(f"[!] WORKER_ERROR: {type(e).__name__}: {e}\n")
+                code = 1
+            finally:
+                sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+                # The client waits for this frame; it must go out whatever happened above
+                self.connection.sendall(_HEADER.pack(FRAME_EXIT, int(code) & 0xFF))
+
+    class Server(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+        pass
+
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    problem = _untrusted_dir(directory)
+    if problem is None and os.path.lexists(socket_path):
+        problem = _untrusted_socket(socket_path)
+        if problem is None:
+            if _connect(socket_path) is not None:
+                print(f">>> WORKER_ALREADY_RUNNING: {socket_path}", file=sys.stderr)
+                return 1
+            os.unlink(socket_path)
+    if problem is not None:
+        print(f"!!! ERR: UNSAFE_SOCKET_PATH: {problem}", file=sys.stderr)
+        return 1
+
+    # Bind under a restrictive umask so the socket is never reachable by others, even briefly
+    umask = os.umask(0o177)
+    try:
+        server = Server(socket_path, Handler)
+    finally:
+        os.umask(umask)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f">>> WARM_WORKER_ONLINE: {socket_path} | pid {os.getpid()} | kernels loaded in {warm_s * 1000:.0f} ms",
+          file=sys.stderr)
+    try:
+        server.serve_forever()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+    return 0
+
+
+def _untrusted_dir(path):
+    """Reason the socket directory could let another user swap the socket, or None."""
+    st = os.stat(path)
+    if st.st_uid not in (os.getuid(), 0):
+        return f"{path} is owned by uid {st.st_uid}"
+    if st.st_mode & 0o022 and not st.st_mode & stat.S_ISVTX:
+        return f"{path} is writable by other users (mode {stat.S_IMODE(st.st_mode):o})"
+    return None
+
+
+def _untrusted_socket(path):
+    """Reason the socket at `path` must not be trusted with a forwarded command, or None."""
+    st = os.lstat(path)
+    if not stat.S_ISSOCK(st.st_mode):
+        return f"{path} is not a socket"
+    if st.st_uid != os.getuid():
+        return f"{path} is owned by uid {st.st_uid}"
+    if st.st_mode & 0o077:
+        return f"{path} is accessible to other users (mode {stat.S_IMODE(st.st_mode):o})"
+    return None
+
+
+def _connect(socket_path):
+    try:
+        problem = _untrusted_socket(socket_path)
+    except OSError:
+        return None
+    if problem is not None:
+        # Someone else's socket: run locally rather than hand it our argv and stdin
+        print(f"[!] IGNORING_WARM_WORKER: {problem}", file=sys.stderr)
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(socket_path)
+    except OSError:
+        conn.close()
+        return None
+    return conn
+
+
+def _recv_exact(conn, n):
+    chunks = []
+    while n:
+        chunk = conn.recv(n)
+        if not chunk:
+            raise ConnectionError("warm worker closed the connection")
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+def forward(conn, argv):
+    """Sends one command to the warm worker and relays its output; returns the exit code."""
+    stdin = sys.stdin.read() if "-" in argv and not sys.stdin.isatty() else ""
+    request = {"argv": argv, "cwd": os.getcwd(), "stdin": stdin}
+    with conn:
+        conn.sendall(json.dumps(request).encode() + b"\n")
+        while True:
+            tag, length = _HEADER.unpack(_recv_exact(conn, _HEADER.size))
+            if tag == FRAME_EXIT:
+                return length
+            payload = _recv_exact(conn, length)
+            stream = sys.stdout if tag == FRAME_STDOUT else sys.stderr
+            stream.buffer.write(payload)
+            stream.flush()
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # Global options are parsed up front so the subcommand itself is forwarded untouched
+    args, _ = build_parser().parse_known_args(argv)
+    sub_argv = argv[argv.index(args.command):]
+
+    if args.command == "serve":
+        return serve(args.socket)
+    if args.command == "service":
+        # Long-running server: never forwarded into a worker fork
+        return run_command(sub_argv)
+    if not args.local:
+        conn = _connect(args.socket)
+        if conn is not None:
+            return forward(conn, sub_argv)
+    if args.command in ("ping", "stop"):
+        print(f">>> NO_WARM_WORKER: {args.socket}", file=sys.stderr)
+        return 1
+    return run_command(sub_argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,46 +1,108 @@
 
 import sys
+import csv
+import argparse
 
-def execute_chanonry_protocol(saturates, aromatics, resins, asphaltenes, treatment_fluid, pressure):
+import numpy as np
+
+# Stability Constraint: CII < 0.9
+CII_STABILITY_LIMIT = 0.9
+ACID_MARKERS = ("ACID", "HCL", "HF")
+
+VERDICT_STABLE = "STABLE"
+VERDICT_UNSTABLE = "OIL_UNSTABLE"
+VERDICT_VETO = "EMERGENCY_VETO"
+
+SARA_COLUMNS = ("saturates", "aromatics", "resins", "asphaltenes", "treatment_fluid", "pressure")
+
+
+def screen_sara_batch(saturates, aromatics, resins, asphaltenes, treatment_fluid, pressure):
     """
-    BRAHAN_SEER INDUSTRIAL ENGINE: ASPHALTENE_STABILITY_V4
-    Predicts precipitation risk using the Colloidal Instability Index (CII).
-    
-    Formula: CII = (Saturates + Asphaltenes) / (Aromatics + Resins)
-    Stability Constraint: CII < 0.9
+    BRAHAN_SEER INDUSTRIAL ENGINE: ASPHALTENE_STABILITY_V4 (BATCH)
+    Vectorized CII screening over any number of samples in one NumPy pass.
+
+    Returns a column table (dict of equal-length arrays) with the inputs plus
+    cii, is_acid, is_unstable, veto and verdict. No output, no process exit.
     """
-    
-    # Header
+    saturates = np.asarray(saturates, dtype=float)
+    aromatics = np.asarray(aromatics, dtype=float)
+    resins = np.asarray(resins, dtype=float)
+    asphaltenes = np.asarray(asphaltenes, dtype=float)
+    pressure = np.broadcast_to(np.asarray(pressure, dtype=float), saturates.shape)
+    fluid = np.broadcast_to(np.asarray(treatment_fluid, dtype=str), saturates.shape)
+
+    # Colloidal Instability Index: CII = (Saturates + Asphaltenes) / (Aromatics + Resins)
+    # A zero peptizing fraction is treated as unbounded instability
+    denominator = aromatics + resins
+    cii = np.divide(saturates + asphaltenes, denominator,
+                    out=np.full(saturates.shape, np.inf), where=denominator != 0)
+
+    # Lab tables reuse a handful of fluids, so acid markers are matched once per distinct fluid
+    fluids, inverse = np.unique(fluid, return_inverse=True)
+    acid_fluids = np.array([any(marker in name.upper() for marker in ACID_MARKERS) for name in fluids], dtype=bool)
+    is_acid = acid_fluids[inverse].reshape(saturates.shape)
+
+    is_unstable = cii > CII_STABILITY_LIMIT
+    veto = is_unstable & is_acid
+    verdict = np.where(veto, VERDICT_VETO, np.where(is_unstable, VERDICT_UNSTABLE, VERDICT_STABLE))
+
+    return {
+        "saturates": saturates,
+        "aromatics": aromatics,
+        "resins": resins,
+        "asphaltenes": asphaltenes,
+        "treatment_fluid": fluid,
+        "pressure": pressure,
+        "cii": cii,
+        "is_acid": is_acid,
+        "is_unstable": is_unstable,
+        "veto": veto,
+        "verdict": verdict,
+    }
+
+
+def load_sara_csv(path):
+    """Reads a SARA lab export with columns named as in SARA_COLUMNS."""
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    return {name: [row[name] for row in rows] for name in SARA_COLUMNS}
+
+
+def write_screening_csv(table, out):
+    """Writes a screening table as CSV to a file-like object."""
+    columns = list(table)
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    writer.writerows(zip(*(table[name].tolist() for name in columns)))
+
+
+def render_chanonry_report(table, row=0):
+    """Console renderer for one screened sample (the original single-sample output)."""
     print("\n" + "="*50)
     print(">>> INITIATING CHANONRY_PROTOCOL_V4.1")
     print(">>> AUTHOR: BRAHAN_SEER_ENGINE")
     print(">>> CORPORATE_AUTH: WELLTEGRA_LTD_SC876023")
     print("="*50)
 
-    # Calculate Colloidal Instability Index (CII)
-    cii = (saturates + asphaltenes) / (aromatics + resins)
-    is_acid = any(acid in treatment_fluid.upper() for acid in ["ACID", "HCL", "HF"])
-    
     # Telemetry Output
     print(f"\n[TELEMETRY_STREAM]")
-    print(f"> SATURATES:    {saturates:>6.2f} %")
-    print(f"> AROMATICS:    {aromatics:>6.2f} %")
-    print(f"> RESINS:       {resins:>6.2f} %")
-    print(f"> ASPHALTENES:  {asphaltenes:>6.2f} %")
-    print(f"> PUMP_FLUID:   {treatment_fluid.upper()}")
-    print(f"> BHP_PRESSURE: {pressure:>6.2f} PSI")
+    print(f"> SATURATES:    {table['saturates'][row]:>6.2f} %")
+    print(f"> AROMATICS:    {table['aromatics'][row]:>6.2f} %")
+    print(f"> RESINS:       {table['resins'][row]:>6.2f} %")
+    print(f"> ASPHALTENES:  {table['asphaltenes'][row]:>6.2f} %")
+    print(f"> PUMP_FLUID:   {table['treatment_fluid'][row].upper()}")
+    print(f"> BHP_PRESSURE: {table['pressure'][row]:>6.2f} PSI")
     print("-" * 30)
-    print(f"CII_CALCULATED: {cii:>6.4f}")
+    print(f"CII_CALCULATED: {table['cii'][row]:>6.4f}")
     print("-" * 30)
 
     # Diagnostic Logic
-    if cii > 0.9:
+    if table['is_unstable'][row]:
         print("\n!!! CRITICAL_STABILITY_ALERT: UNSTABLE_COLLOIDAL_STRUCTURE !!!")
-        if is_acid:
+        if table['veto'][row]:
             print("!!! WARNING: ACID_INDUCTION_WILL_TRIGGER_SLUDGE_FORMATION !!!")
             print("!!! RIBBONS OF BLACK DETECTED !!!")
             print("!!! PREVENT THE BARREL. EXECUTE EMERGENCY_VETO. !!!")
-            sys.exit(1) # Mechanical Veto
         else:
             print(">>> WARNING: OIL_UNSTABLE. BITUMEN_FLOC_POSSIBLE.")
             print(">>> RECOMMEND: RE-EVALUATE_STIMULATION_CHEMISTRY.")
@@ -48,7 +110,38 @@ def execute_chanonry_protocol(saturates, aromatics, resins, asphaltenes, treatme
         print("\n>>> STATUS: STABLE. COLLOIDAL_STRUCTURE_WITHIN_TOLERANCE.")
         print(">>> NO_BITUMEN_RISK_DETECTED. PROCEED_WITH_PUMP.")
 
+
+def execute_chanonry_protocol(saturates, aromatics, resins, asphaltenes, treatment_fluid, pressure):
+    """
+    BRAHAN_SEER INDUSTRIAL ENGINE: ASPHALTENE_STABILITY_V4
+    Predicts precipitation risk using the Colloidal Instability Index (CII).
+    
+    Formula: CII = (Saturates + Asphaltenes) / (Aromatics + Resins)
+    Stability Constraint: CII < 0.9
+    """
+    table = screen_sara_batch([saturates], [aromatics], [resins], [asphaltenes], [treatment_fluid], [pressure])
+    render_chanonry_report(table)
+    if table['veto'][0]:
+        sys.exit(1) # Mechanical Veto
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Chanonry Protocol: batch SARA asphaltene-stability screening')
+    parser.add_argument('--csv', type=str, help='SARA sample table (saturates,aromatics,resins,asphaltenes,treatment_fluid,pressure)')
+    parser.add_argument('--out', type=str, help='Screening table output path (default: stdout)')
+    args = parser.parse_args()
+
+    if args.csv:
+        table = screen_sara_batch(**load_sara_csv(args.csv))
+        if args.out:
+            with open(args.out, 'w', newline='') as out:
+                write_screening_csv(table, out)
+        else:
+            write_screening_csv(table, sys.stdout)
+        print(f">>> SCREENED: {len(table['cii'])} samples | UNSTABLE: {int(table['is_unstable'].sum())} | VETO: {int(table['veto'].sum())}",
+              file=sys.stderr)
+        sys.exit(0)
+
     # Example invocation with unstable oil + acid treatment
     # SARA: 35.5, 25.0, 20.0, 19.5 -> CII = (35.5 + 19.5) / (25 + 20) = 1.22 (UNSTABLE)
     execute_chanonry_protocol(
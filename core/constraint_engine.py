@@ -0,0 +1,137 @@
+"""
+BRAHAN_SEER MULTI-AGENT KERNEL: CONSTRAINT_ENGINE v1.0
+Declarative Earth-System constraint table shared by every CriticAgent.
+Rules compile once into bound vectors; batches of artifacts are validated as columnar arrays.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+
+# One measured-depth envelope for every depth field an executor reports, so a well cannot
+# pass as `depth` and fail as `depth_end` (or the reverse) depending on which critic reads it.
+MAX_WELL_DEPTH = 40000  # feet
+DEPTH_FIELDS = ("depth", "depth_start", "depth_end")
+
+# EARTH_SYSTEM_CONSTRAINTS
+# field: artifact key the rule applies to; min/max: inclusive physical envelope; veto: reason.
+EARTH_SYSTEM_RULES = [
+    *({"field": field, "max": MAX_WELL_DEPTH,
+       "veto": "Depth violates lithospheric limit."} for field in DEPTH_FIELDS),
+    {"field": "gr_max", "max": 500,
+     "veto": "GR exceeds standard API calibration envelope."},                   # API, MAX_GAMMA_API
+    {"field": "gr_api", "max": 500,
+     "veto": "GR exceeds standard API calibration envelope."},
+    {"field": "recovery_factor", "max": 0.85,
+     "veto": "Unrealistic recovery factor. Violates pore-scale efficiency limits."},
+]
+
+
+class ConstraintReport:
+    """
+    Result of a batch validation: one row per artifact, one column per rule.
+    `malformed` flags constrained fields (engine.columns) present with a non-numeric value.
+    """
+    def __init__(self, engine: "ConstraintEngine", violations: np.ndarray, malformed: np.ndarray = None):
+        self.engine = engine
+        self.violations = violations
+        if malformed is None:
+            malformed = np.zeros((len(violations), len(engine.columns)), dtype=bool)
+        self.malformed = malformed
+        self.vetoed = violations.any(axis=1) | malformed.any(axis=1)
+
+    def __len__(self):
+        return len(self.vetoed)
+
+    def reasons(self, index: int) -> List[str]:
+        reasons = ([self.engine.malformed_message(self.engine.columns[j]) for j in np.flatnonzero(self.malformed[index])] +
+                   [self.engine.messages[j] for j in np.flatnonzero(self.violations[index])])
+        # Rules sharing a message (e.g. every depth field) are reported once
+        return list(dict.fromkeys(reasons))
+
+    def all_reasons(self) -> List[List[str]]:
+        return [self.reasons(i) if vetoed else [] for i, vetoed in enumerate(self.vetoed)]
+
+    def counts(self) -> Dict[str, int]:
+        """Veto count per rule message, for summarising large sample runs."""
+        totals = self.violations.sum(axis=0)
+        counts = {}
+        for j in np.flatnonzero(totals):
+            counts[self.engine.messages[j]] = counts.get(self.engine.messages[j], 0) + int(totals[j])
+        malformed = self.malformed.sum(axis=0)
+        for j in np.flatnonzero(malformed):
+            counts[self.engine.malformed_message(self.engine.columns[j])] = int(malformed[j])
+        return counts
+
+
+class ConstraintEngine:
+    """Compiles a rule table into per-rule field/lower/upper vectors."""
+    def __init__(self, rules: Sequence[Mapping[str, Any]] = EARTH_SYSTEM_RULES):
+        self.fields = [rule["field"] for rule in rules]
+        self.lower = np.array([rule.get("min", -np.inf) for rule in rules], dtype=float)
+        self.upper = np.array([rule.get("max", np.inf) for rule in rules], dtype=float)
+        self.messages = [rule["veto"] for rule in rules]
+        # Each distinct field is gathered once even when several rules read it
+        self.columns = sorted(set(self.fields))
+        column_index = {name: i for i, name in enumerate(self.columns)}
+        self.rule_column = np.array([column_index[name] for name in self.fields], dtype=np.intp)
+
+    @staticmethod
+    def _is_number(value: Any) -> bool:
+        return isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+
+    @classmethod
+    def _numeric(cls, value: Any) -> float:
+        return float(value) if cls._is_number(value) else np.nan
+
+    @staticmethod
+    def malformed_message(field: str) -> str:
+        return f"Non-numeric {field} cannot be checked against its physical envelope."
+
+    def validate_columns(self, columns: Mapping[str, Any], n: int = None) -> ConstraintReport:
+        """
+        Validates columnar data (field -> array of samples). Absent fields and NaN samples
+        are out of scope for a rule rather than a violation.
+        """
+        if n is None:
+            n = max((len(values) for values in columns.values()), default=0)
+        violations = np.zeros((n, len(self.fields)), dtype=bool)
+        for name in self.columns:
+            if name not in columns:
+                continue
+            values = np.asarray(columns[name], dtype=float)[:, None]
+            rules = np.flatnonzero(self.rule_column == self.columns.index(name))
+            # NaN compares False on both sides, so missing samples never veto
+            violations[:, rules] = (values < self.lower[rules]) | (values > self.upper[rules])
+        return ConstraintReport(self, violations)
+
+    def validate_batch(self, artifacts: Iterable[Mapping[str, Any]]) -> ConstraintReport:
+        """
+        Validates a batch of artifact dicts by gathering the constrained fields into columns.
+        A constrained field that is present but not a number (e.g. "50000") is a violation:
+        it would otherwise become NaN and slip past every bound. None counts as absent.
+        """
+        artifacts = list(artifacts)
+        columns = {}
+        malformed = np.zeros((len(artifacts), len(self.columns)), dtype=bool)
+        for j, name in enumerate(self.columns):
+            values = [a.get(name) for a in artifacts]
+            columns[name] = np.fromiter((self._numeric(v) for v in values), float, len(values))
+            malformed[:, j] = [v is not None and not self._is_number(v) for v in values]
+        report = self.validate_columns(columns, len(artifacts))
+        return ConstraintReport(self, report.violations, malformed)
+
+    def validate(self, artifact: Mapping[str, Any]) -> List[str]:
+        """Veto reasons for a single artifact (empty list when it passes)."""
+        return self.validate_batch([artifact]).reasons(0)
+
+
+_default_engine = None
+
+
+def default_engine() -> ConstraintEngine:
+    """Shared engine compiled once from EARTH_SYSTEM_RULES."""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = ConstraintEngine()
+    return _default_engine
@@ -9,6 +9,10 @@ import time
 import hashlib
 import json
 
+import numpy as np
+
+import telemetry
+
 class DDRForensicScraper:
     def __init__(self):
         self.suspicious_producers = ["Quartz PDF Context", "Microsoft Excel Export", "Adobe PDF Library 15.0"]
@@ -22,6 +26,7 @@ class DDRForensicScraper:
         # High zero-diff ratio in high-frequency logs (like GR) suggests copy-pasting
         return 1.0 - (zero_diff_count / len(diffs))
 
+    @telemetry.instrument("ddr.audit_metadata")
     def audit_metadata(self, artifact_path, metadata_dict):
         """
         Cross-references creation dates against report dates.
@@ -50,6 +55,7 @@ class DDRForensicScraper:
         if metadata_dict.get("mod_count", 0) > 3:
             flags.append(f"EDIT_TRAIL_VERBOSE: {metadata_dict['mod_count']} revisions detected. High potential for 'smoothing'.")
 
+        telemetry.count("ddr.flags", len(flags))
         return {
             "artifact": artifact_path,
             "integrity_score": max(0, 100 - (len(flags) * 25)),
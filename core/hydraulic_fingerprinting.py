@@ -9,12 +9,15 @@ Enhanced with Kalman Filtering for signal denoising.
 import numpy as np
 import time
 
+import telemetry
+
 class HydraulicFingerprinter:
     def __init__(self, initial_pressure=2500, wave_speed=1450):
         self.Pi = initial_pressure  # PSI
         self.Vs = wave_speed       # m/s (acoustic velocity in fluid)
         self.tau = 4.5             # Decay constant (system damping)
 
+    @telemetry.instrument("hydraulic.apply_kalman_filter", samples=lambda self, z, *a, **k: len(z))
     def apply_kalman_filter(self, z, q=0.1, r=10.0):
         """
         Simple 1D Kalman Filter to denoise pressure telemetry.
@@ -48,6 +51,7 @@ class HydraulicFingerprinter:
         """Model the base pressure decay: P(t) = Pi + ΔP * e^(-t/τ)"""
         return self.Pi + delta_p * np.exp(-t / self.tau)
 
+    @telemetry.instrument("hydraulic.process_signal", samples=lambda self, t, raw, *a, **k: len(raw))
     def process_signal(self, time_array, raw_pressure, delta_p):
         """
         Extracts echoes by denoising the signal via Kalman Filter, 
@@ -56,7 +60,11 @@ class HydraulicFingerprinter:
         print(">>> INITIATING_HYDRAULIC_FINGERPRINT_ANALYSIS")
         print(">>> APPLYING_KALMAN_DENOISING_PROTOCOL...")
         time.sleep(0.5)
-        
+        return self.extract_echoes(time_array, raw_pressure, delta_p)
+
+    @telemetry.instrument("hydraulic.extract_echoes", samples=lambda self, t, raw, *a, **k: len(raw))
+    def extract_echoes(self, time_array, raw_pressure, delta_p):
+        """Console-free core of process_signal, for services and batch callers."""
         # 1. Denoise the raw signal
         filtered_pressure = self.apply_kalman_filter(raw_pressure)
         
@@ -87,6 +95,7 @@ class HydraulicFingerprinter:
                     "status": "PHANTOM_STEEL_DETECTED" if depth > 500 else "SURFACE_REFLECTION"
                 })
             
+        telemetry.count("hydraulic.echoes", len(echoes))
         return echoes
 
     def run_audit(self):
@@ -0,0 +1,142 @@
+"""
+BRAHAN_SEER MULTI-AGENT KERNEL: MISSION_VAULT v1.0
+Persistent, bounded store of critic-verified task artifacts plus a per-mission journal.
+Re-runs of a mission consult its journal: tasks it records as VERIFIED are restored from
+the vault instead of re-calling the executor, so the run resumes at the first task that
+never reached VERIFIED.
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    key TEXT PRIMARY KEY,
+    action TEXT NOT NULL,
+    params TEXT NOT NULL,
+    artifact TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS artifacts_lru ON artifacts (last_used);
+CREATE INDEX IF NOT EXISTS artifacts_action ON artifacts (action);
+CREATE TABLE IF NOT EXISTS journal (
+    mission_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    artifact_key TEXT,
+    ts REAL NOT NULL,
+    PRIMARY KEY (mission_id, task_id)
+);
+"""
+
+
+def artifact_key(action: str, params: Any) -> str:
+    """Stable cache key for an executor call: action + canonical JSON params."""
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{action}\x1f{canonical}".encode()).hexdigest()
+
+
+def mission_id(namespace: str, goal: str) -> str:
+    """
+    Journal key for a goal, scoped by orchestrator: both orchestrators number their tasks
+    T1..T4, so a shared vault must not let one resume from the other's journal.
+    """
+    return hashlib.sha256(f"{namespace}\x1f{goal}".encode()).hexdigest()[:16]
+
+
+class MissionVault:
+    """
+    SQLite-backed artifact vault.
+    max_entries bounds the artifact table (least-recently-used rows are evicted);
+    max_age_s, when set, treats older artifacts as invalid.
+    """
+    def __init__(self, path: str = "mission_vault.db", max_entries: int = 10000,
+                 max_age_s: Optional[float] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_s = max_age_s
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.executescript(_SCHEMA)
+        # Concurrent missions call in from worker threads; serialize access to the connection
+        self.lock = threading.RLock()
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    # --- Artifact cache -------------------------------------------------
+
+    def get(self, action: str, params: Any) -> Optional[Any]:
+        return self._load(artifact_key(action, params))
+
+    def _load(self, key: str) -> Optional[Any]:
+        with self.lock:
+            row = self.db.execute("SELECT artifact, created FROM artifacts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if self.max_age_s is not None and time.time() - row[1] > self.max_age_s:
+                self.db.execute("DELETE FROM artifacts WHERE key = ?", (key,))
+                return None
+            self.db.execute("UPDATE artifacts SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, action: str, params: Any, artifact: Any) -> str:
+        key = artifact_key(action, params)
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO artifacts (key, action, params, artifact, created, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, action, json.dumps(params, default=str), json.dumps(artifact, default=str), now, now))
+            # Bounded size: evict least-recently-used artifacts past max_entries
+            overflow = self.db.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self.db.execute(
+                    "DELETE FROM artifacts WHERE key IN (SELECT key FROM artifacts ORDER BY last_used ASC LIMIT ?)",
+                    (overflow,))
+        return key
+
+    def invalidate(self, action: Optional[str] = None, params: Any = None, key: Optional[str] = None) -> int:
+        """
+        Explicit invalidation: one entry (action + params, or key), every entry for an
+        action, or the whole vault when called without arguments. Returns rows removed.
+        """
+        if key is None and action is not None and params is not None:
+            key = artifact_key(action, params)
+        with self.lock:
+            if key is not None:
+                cursor = self.db.execute("DELETE FROM artifacts WHERE key = ?", (key,))
+            elif action is not None:
+                cursor = self.db.execute("DELETE FROM artifacts WHERE action = ?", (action,))
+            else:
+                cursor = self.db.execute("DELETE FROM artifacts")
+            return cursor.rowcount
+
+    # --- Mission journal ------------------------------------------------
+
+    def record(self, mission: str, task_id: str, status: str, key: Optional[str] = None):
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO journal (mission_id, task_id, status, artifact_key, ts) VALUES (?, ?, ?, ?, ?)",
+                (mission, task_id, status, key, time.time()))
+
+    def journal(self, mission: str) -> Dict[str, str]:
+        with self.lock:
+            rows = self.db.execute("SELECT task_id, status FROM journal WHERE mission_id = ? ORDER BY ts", (mission,))
+            return dict(rows.fetchall())
+
+    def restore(self, mission: str, task_id: str) -> Optional[Any]:
+        """
+        Artifact of a task this mission's journal records as VERIFIED, or None when the
+        task must run (never verified, vetoed, or its artifact was evicted or expired).
+        """
+        with self.lock:
+            row = self.db.execute("SELECT status, artifact_key FROM journal WHERE mission_id = ? AND task_id = ?",
+                                  (mission, task_id)).fetchone()
+        if row is None or row[0] != "VERIFIED" or row[1] is None:
+            return None
+        return self._load(row[1])
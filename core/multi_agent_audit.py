@@ -7,8 +7,12 @@ Goal: Forensic Reservoir Identification
 
 import time
 import json
-from dataclasses import dataclass
-from typing import List, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
+
+from task_scheduler import ScheduledTask, run_dag
+from mission_vault import MissionVault, mission_id
+from constraint_engine import ConstraintReport, default_engine
 
 @dataclass
 class Task:
@@ -16,6 +20,7 @@ class Task:
     description: str
     status: str = "PENDING"
     artifact: Any = None
+    depends_on: List[str] = field(default_factory=list)
 
 class ReasoningAgent:
     """The Architect: Decomposes high-level objectives into physical tasks."""
@@ -27,9 +32,9 @@ class ReasoningAgent:
         # Chain-of-Thought (CoT) simulation
         tasks = [
             Task("T1", "Harvest legacy LAS/DLIS metadata from NDR for Thistle Field."),
-            Task("T2", "Identify datum-ghosts via cross-correlation of GR traces."),
-            Task("T3", "Extract petrophysical artifacts from bypassed pay intervals."),
-            Task("T4", "Calculate net-pay volume and fiscal recovery potential.")
+            Task("T2", "Identify datum-ghosts via cross-correlation of GR traces.", depends_on=["T1"]),
+            Task("T3", "Extract petrophysical artifacts from bypassed pay intervals.", depends_on=["T1"]),
+            Task("T4", "Calculate net-pay volume and fiscal recovery potential.", depends_on=["T2", "T3"])
         ]
         return tasks
 
@@ -55,41 +60,122 @@ class CriticAgent:
 
     def verify_action(self, prediction: Any) -> bool:
         print(f"[{self.name}] AUDITING PHYSICAL CONSTRAINTS...")
-        # 1. Lithospheric Limit Check
-        if "depth" in prediction and prediction["depth"] > 45000:
-            print("!!! VETO: Depth exceeds brittle-ductile transition zone limits.")
-            return False
-        # 2. Conservation of Mass / Fluid Dynamics Check
-        if "recovery_factor" in prediction and prediction["recovery_factor"] > 0.85:
-            print("!!! VETO: Unrealistic recovery factor. Violates pore-scale efficiency limits.")
+        # Lithospheric, calibration and conservation-of-mass limits live in the shared rule table
+        reasons = default_engine().validate(prediction)
+        for reason in reasons:
+            print(f"!!! VETO: {reason}")
+        if reasons:
             return False
         
         print(">>> CONSTRAINT CHECK PASSED: Result remains within Earth System envelope.")
         return True
 
+    def verify_batch(self, predictions: List[Dict[str, Any]]) -> ConstraintReport:
+        """Columnar physics veto over a whole batch of artifacts; no per-item logging."""
+        return default_engine().validate_batch(predictions)
+
 class AuditOrchestrator:
-    def __init__(self):
+    VAULT_NAMESPACE = "multi_agent_audit"
+
+    def __init__(self, vault: Optional[MissionVault] = None):
         self.reasoner = ReasoningAgent()
         self.executor = ExecutionAgent()
         self.critic = CriticAgent()
+        # Optional persistent vault: verified artifacts survive aborts and crashes
+        self.vault = vault
+
+    @staticmethod
+    def _cache_params(task: Task) -> Dict[str, str]:
+        return {"task": task.id, "description": task.description}
+
+    def _restore(self, mission: str, task: Task) -> Optional[Any]:
+        if self.vault is None:
+            return None
+        return self.vault.restore(mission, task.id)
+
+    def _archive(self, mission: str, task: Task):
+        if self.vault is None:
+            return
+        key = None
+        if task.status == "VERIFIED":
+            key = self.vault.put("CALL_NDR_API", self._cache_params(task), task.artifact)
+        self.vault.record(mission, task.id, task.status, key)
 
     def run(self, mission_goal: str):
         print("--- COMMENCING SOVEREIGN INDUSTRIAL AUDIT ---")
         tasks = self.reasoner.decompose_mission(mission_goal)
+        mission = mission_id(self.VAULT_NAMESPACE, mission_goal)
         
         vault = []
         for task in tasks:
+            restored = self._restore(mission, task)
+            if restored is not None:
+                print(f">>> RESTORED FROM VAULT: {task.id} (executor call skipped)")
+                task.artifact = restored
+                task.status = "VERIFIED"
+                vault.append(task)
+                continue
+
+            if self.vault is not None:
+                self.vault.record(mission, task.id, "RUNNING")
             result = self.executor.call_ndr_api(task)
             if self.critic.verify_action(result):
                 task.artifact = result
                 task.status = "VERIFIED"
                 vault.append(task)
+                self._archive(mission, task)
             else:
                 task.status = "ABORTED_BY_PHYSICS_VETO"
+                self._archive(mission, task)
                 break
         
         print(f"--- MISSION COMPLETE: {len(vault)}/4 TASKS ARCHIVED ---")
 
+    def run_concurrent(self, mission_goal: str, max_concurrency: int = 4):
+        """
+        Dependency-aware variant of `run`: independent tasks execute concurrently,
+        a physics veto cancels only the tasks downstream of the vetoed one.
+        """
+        print("--- COMMENCING SOVEREIGN INDUSTRIAL AUDIT [CONCURRENT] ---")
+        tasks = self.reasoner.decompose_mission(mission_goal)
+        mission = mission_id(self.VAULT_NAMESPACE, mission_goal)
+        scheduled = []
+        for task in tasks:
+            restored = self._restore(mission, task)
+            if restored is not None:
+                scheduled.append(ScheduledTask(task.id, lambda restored=restored: restored, task.depends_on, preverified=True))
+            else:
+                scheduled.append(ScheduledTask(task.id, lambda task=task: self.executor.call_ndr_api(task), task.depends_on))
+
+        def on_event(event, outcome):
+            if event == "VERIFIED" and outcome.preverified:
+                # Already journaled as VERIFIED; re-archiving would reset the artifact's age
+                print(f">>> RESTORED FROM VAULT: {outcome.id} (executor call skipped)")
+                return
+            if event in ("VERIFIED", "VETOED", "FAILED"):
+                task = next(t for t in tasks if t.id == outcome.id)
+                task.status, task.artifact = outcome.status, outcome.artifact
+                self._archive(mission, task)
+
+        report = run_dag(scheduled, self.critic.verify_action, max_concurrency, on_event)
+
+        vault = []
+        for task in tasks:
+            outcome = report["tasks"][task.id]
+            task.status = outcome.status
+            if outcome.status == "VERIFIED":
+                task.artifact = outcome.artifact
+                vault.append(task)
+
+        for tid, timing in report["timings"].items():
+            if timing["duration"] is not None:
+                print(f"[{tid}] {timing['status']} | {timing['start']:.2f}s -> {timing['end']:.2f}s ({timing['duration']:.2f}s)")
+            else:
+                print(f"[{tid}] {timing['status']}")
+        print(f"--- CRITICAL PATH: {' -> '.join(report['critical_path'])} | WALL CLOCK: {report['wall_clock']:.2f}s ---")
+        print(f"--- MISSION COMPLETE: {len(vault)}/{len(tasks)} TASKS ARCHIVED ---")
+        return report
+
 if __name__ == "__main__":
     audit = AuditOrchestrator()
     audit.run("Identify untapped reserves in the Thistle Field via Datum Alignment")
@@ -2,7 +2,12 @@
 import time
 import json
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from task_scheduler import ScheduledTask, run_dag
+from mission_vault import MissionVault, mission_id
+from constraint_engine import ConstraintReport, default_engine
+import telemetry
 
 # =================================================================
 # BRAHAN_SEER MULTI-AGENT KERNEL v1.0
@@ -16,21 +21,22 @@ class BaseAgent:
 
     def log(self, message: str, color: str = "32"): # Default Green
         timestamp = time.strftime("%H:%M:%S")
+        telemetry.event(f"{self.name}.log", message=message)
         print(f"\033[{color}m[{timestamp}] [{self.name} // {self.role}] {message}\033[0m")
 
 class ReasoningAgent(BaseAgent):
     """Decomposes high-level missions into a sequence of forensic tasks."""
     
-    def decompose_goal(self, goal: str) -> List[Dict[str, str]]:
+    def decompose_goal(self, goal: str) -> List[Dict[str, Any]]:
         self.log(f"INITIATING_DECOMPOSITION: {goal}")
         time.sleep(1)
         
         # Simulated decomposition logic
         tasks = [
-            {"id": "T1", "action": "SEARCH_NDR", "params": "Field=Thistle;Project=Legacy_Logs"},
-            {"id": "T2", "action": "IDENTIFY_GHOSTS", "params": "Filter=Datum_Shift_Probability"},
-            {"id": "T3", "action": "EXTRACT_GR", "params": "Zone=Mungaroo_Sand"},
-            {"id": "T4", "action": "CROSS_CORRELATE", "params": "Method=Least_Squares"}
+            {"id": "T1", "action": "SEARCH_NDR", "params": "Field=Thistle;Project=Legacy_Logs", "depends_on": []},
+            {"id": "T2", "action": "IDENTIFY_GHOSTS", "params": "Filter=Datum_Shift_Probability", "depends_on": ["T1"]},
+            {"id": "T3", "action": "EXTRACT_GR", "params": "Zone=Mungaroo_Sand", "depends_on": ["T1"]},
+            {"id": "T4", "action": "CROSS_CORRELATE", "params": "Method=Least_Squares", "depends_on": ["T2", "T3"]}
         ]
         
         self.log(f"STRATEGY_LOCKED: {len(tasks)} tasks identified.")
@@ -39,6 +45,7 @@ class ReasoningAgent(BaseAgent):
 class ExecutionAgent(BaseAgent):
     """Interacts with external APIs and Data Repositories (NDR)."""
     
+    @telemetry.instrument("executor.execute_task")
     def execute_task(self, task: Dict[str, str]) -> Dict[str, Any]:
         self.log(f"EXECUTING_{task['action']}: {task['params']}", "34") # Blue
         time.sleep(1.5)
@@ -58,46 +65,73 @@ class CriticAgent(BaseAgent):
         self.log("AUDITING_PHYSICAL_CONSTRAINTS...", "31") # Red
         time.sleep(0.8)
         
-        # EARTH_SYSTEM_CONSTRAINTS
-        MAX_WELL_DEPTH = 40000 # feet
-        MAX_GAMMA_API = 500
-        
-        if "depth_end" in proposed_data and proposed_data["depth_end"] > MAX_WELL_DEPTH:
-            self.log("VETO_TRIGGERED: Depth violates lithospheric limit.", "31")
-            return False
-            
-        if "gr_max" in proposed_data and proposed_data["gr_max"] > MAX_GAMMA_API:
-            self.log("VETO_TRIGGERED: GR exceeds standard API calibration envelope.", "31")
+        # EARTH_SYSTEM_CONSTRAINTS: shared declarative rule table (see constraint_engine)
+        reasons = default_engine().validate(proposed_data)
+        for reason in reasons:
+            self.log(f"VETO_TRIGGERED: {reason}", "31")
+        if reasons:
             return False
             
         self.log("PHYSICS_VALIDATED: No discordance detected in proposed artifacts.")
         return True
 
+    def verify_batch(self, artifacts: List[Dict[str, Any]]) -> ConstraintReport:
+        """Columnar physics veto over harvested artifacts or log samples; logs a single summary."""
+        report = default_engine().validate_batch(artifacts)
+        self.log(f"BATCH_AUDIT: {int(report.vetoed.sum())}/{len(report)} artifacts vetoed.", "31" if report.vetoed.any() else "32")
+        return report
+
 class AuditOrchestrator:
     """The central hub connecting the Reasoning, Execution, and Critic agents."""
-    
-    def __init__(self):
+    VAULT_NAMESPACE = "multi_agent_framework"
+
+    def __init__(self, vault: Optional[MissionVault] = None):
         self.reasoner = ReasoningAgent("ALPHA_VETO", "ARCHITECT")
         self.executor = ExecutionAgent("HARVESTER_01", "OPERATOR")
         self.critic = CriticAgent("CERBERUS_SCAN", "PHYSICIST")
+        # Optional persistent vault: verified artifacts survive aborts and crashes
+        self.vault = vault
+
+    def _restore(self, mission: str, task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if self.vault is None:
+            return None
+        return self.vault.restore(mission, task['id'])
+
+    def _archive(self, mission: str, task: Dict[str, Any], status: str, artifact: Any = None):
+        if self.vault is None:
+            return
+        key = self.vault.put(task['action'], task['params'], artifact) if status == "VERIFIED" else None
+        self.vault.record(mission, task['id'], status, key)
         
+    @telemetry.instrument("orchestrator.run_mission")
     def run_mission(self, goal: str):
         print("\n" + "="*60)
         print(">>> COMMENCING SOVEREIGN INDUSTRIAL AUDIT")
         print("="*60)
         
         tasks = self.reasoner.decompose_goal(goal)
+        mission = mission_id(self.VAULT_NAMESPACE, goal)
         results = []
         
         for task in tasks:
             print("-" * 40)
+            restored = self._restore(mission, task)
+            if restored is not None:
+                results.append(restored)
+                print(f"\033[36m>>> TASK_{task['id']}_RESTORED_FROM_VAULT\033[0m")
+                continue
+
+            if self.vault is not None:
+                self.vault.record(mission, task['id'], "RUNNING")
             artifact = self.executor.execute_task(task)
             
             # The Critic must verify the executor's findings before they enter the state
             if self.critic.verify_action(artifact):
                 results.append(artifact)
+                self._archive(mission, task, "VERIFIED", artifact)
                 print(f"\033[32m>>> TASK_{task['id']}_COMMITTED_TO_VAULT\033[0m")
             else:
+                self._archive(mission, task, "ABORTED_BY_CRITIC")
                 print(f"\033[31m>>> TASK_{task['id']}_ABORTED_BY_CRITIC\033[0m")
                 break # Hard stop on physical violation
                 
@@ -105,6 +139,59 @@ class AuditOrchestrator:
         print(">>> MISSION_COMPLETE: ARCHIVE_SECURED")
         print("="*60)
 
+    @telemetry.instrument("orchestrator.run_mission_concurrent")
+    def run_mission_concurrent(self, goal: str, max_concurrency: int = 4):
+        """
+        Dependency-aware variant of `run_mission`. Tasks run as soon as their
+        `depends_on` tasks are verified; a veto only cancels downstream tasks.
+        """
+        print("\n" + "="*60)
+        print(">>> COMMENCING SOVEREIGN INDUSTRIAL AUDIT [CONCURRENT]")
+        print("="*60)
+
+        tasks = self.reasoner.decompose_goal(goal)
+        by_id = {task['id']: task for task in tasks}
+        mission = mission_id(self.VAULT_NAMESPACE, goal)
+        scheduled = []
+        for task in tasks:
+            restored = self._restore(mission, task)
+            if restored is not None:
+                print(f"\033[36m>>> TASK_{task['id']}_RESTORED_FROM_VAULT\033[0m")
+                scheduled.append(ScheduledTask(task['id'], lambda restored=restored: restored,
+                                               task.get('depends_on', []), preverified=True))
+            else:
+                scheduled.append(ScheduledTask(task['id'], lambda task=task: self.executor.execute_task(task),
+                                               task.get('depends_on', [])))
+
+        def on_event(event, task):
+            if event == "VERIFIED" and task.preverified:
+                return  # restored from the vault (logged above); re-archiving would reset its age
+            if event in ("VERIFIED", "VETOED", "FAILED"):
+                self._archive(mission, by_id[task.id], task.status, task.artifact)
+            if event == "VERIFIED":
+                print(f"\033[32m>>> TASK_{task.id}_COMMITTED_TO_VAULT\033[0m")
+            elif event in ("VETOED", "FAILED"):
+                print(f"\033[31m>>> TASK_{task.id}_ABORTED_BY_CRITIC\033[0m")
+            elif event == "CANCELLED":
+                print(f"\033[33m>>> TASK_{task.id}_CANCELLED_DOWNSTREAM_OF_VETO\033[0m")
+
+        report = run_dag(scheduled, self.critic.verify_action, max_concurrency, on_event)
+        results = [report["tasks"][task['id']].artifact for task in tasks
+                   if report["tasks"][task['id']].status == "VERIFIED"]
+
+        print("-" * 40)
+        for tid, timing in report["timings"].items():
+            if timing["duration"] is not None:
+                print(f"[{tid}] {timing['status']} | {timing['start']:.2f}s -> {timing['end']:.2f}s ({timing['duration']:.2f}s)")
+            else:
+                print(f"[{tid}] {timing['status']}")
+        print(f">>> CRITICAL_PATH: {' -> '.join(report['critical_path'])} | WALL_CLOCK: {report['wall_clock']:.2f}s")
+
+        print("\n" + "="*60)
+        print(f">>> MISSION_COMPLETE: {len(results)}/{len(tasks)} ARTIFACTS SECURED")
+        print("="*60)
+        return report
+
 if __name__ == "__main__":
     orchestrator = AuditOrchestrator()
     orchestrator.run_mission("Identify untapped reserves in the Thistle Field via Datum Alignment")
@@ -8,6 +8,8 @@ import numpy as np
 import json
 import time
 
+import telemetry
+
 class ValveForensics:
     def __init__(self, well_id: str):
         self.well_id = well_id
@@ -41,20 +43,34 @@ class ValveForensics:
         else:
             return "MECHANICAL_SEAL_FAILURE", ratchet_score
 
-    def generate_verdict(self, t_series, p_series):
+    def assess(self, t_series, p_series):
+        """Structured verdict (no console output) behind generate_verdict."""
         pattern, score = self.analyze_decay_pattern(t_series, p_series)
+        telemetry.count(f"valve.verdict.{pattern}")
         scale_prob = self.calculate_scale_probability()
+        remediate = pattern == "SCALE_CHOKE_DETECTED" or scale_prob > 0.8
+        return {
+            "well_id": self.well_id,
+            "pattern": pattern,
+            "ratchet_index": float(score),
+            "scale_growth_prob": float(scale_prob),
+            "recommendation": "CHEMICAL BULLHEAD REMEDIATION (£40k)" if remediate else "VESSEL MOBILIZATION REQUIRED (£8M)",
+            "savings_vs_intervention": "£7.96M" if remediate else None,
+        }
+
+    @telemetry.instrument("valve.generate_verdict", samples=lambda self, t, p: len(p))
+    def generate_verdict(self, t_series, p_series):
+        verdict = self.assess(t_series, p_series)
         
         print(f"\n--- FORENSIC VERDICT: {self.well_id} ---")
-        print(f"> PATTERN: {pattern}")
-        print(f"> RATCHET_INDEX: {score:.2f}")
-        print(f"> SCALE_GROWTH_PROB: {scale_prob * 100:.1f}%")
+        print(f"> PATTERN: {verdict['pattern']}")
+        print(f"> RATCHET_INDEX: {verdict['ratchet_index']:.2f}")
+        print(f"> SCALE_GROWTH_PROB: {verdict['scale_growth_prob'] * 100:.1f}%")
         
-        if pattern == "SCALE_CHOKE_DETECTED" or scale_prob > 0.8:
-            print(">>> RECOMMENDATION: CHEMICAL BULLHEAD REMEDIATION (£40k)")
-            print(">>> SAVINGS vs INTERVENTION: £7.96M")
-        else:
-            print(">>> RECOMMENDATION: VESSEL MOBILIZATION REQUIRED (£8M)")
+        print(f">>> RECOMMENDATION: {verdict['recommendation']}")
+        if verdict['savings_vs_intervention']:
+            print(f">>> SAVINGS vs INTERVENTION: {verdict['savings_vs_intervention']}")
+        return verdict
 
 if __name__ == "__main__":
     # Simulated data for Well D-03
@@ -0,0 +1,162 @@
+"""
+BRAHAN_SEER MULTI-AGENT KERNEL: DEPENDENCY_SCHEDULER v1.0
+Asyncio DAG scheduler for the AuditOrchestrators.
+Independent tasks run concurrently under a cap; the critic audits each result as it lands;
+a physics veto cancels only the tasks downstream of the vetoed one.
+"""
+
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class ScheduledTask:
+    id: str
+    run: Callable[[], Any]
+    depends_on: List[str] = field(default_factory=list)
+    preverified: bool = False  # e.g. restored from the mission vault; skips the critic
+    status: str = "PENDING"
+    artifact: Any = None
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+class DependencyScheduler:
+    """
+    Runs ScheduledTasks as soon as all of their dependencies are VERIFIED.
+    `run` callables and the `verify` critic are blocking and are executed off the event loop.
+    """
+    def __init__(self, verify: Callable[[Any], bool], max_concurrency: int = 4,
+                 on_event: Optional[Callable[[str, ScheduledTask], None]] = None):
+        self.verify = verify
+        self.max_concurrency = max_concurrency
+        self.on_event = on_event or (lambda event, task: None)
+
+    @staticmethod
+    def _validate(tasks: Dict[str, ScheduledTask]):
+        for task in tasks.values():
+            for dep in task.depends_on:
+                if dep not in tasks:
+                    raise ValueError(f"Task {task.id} depends on unknown task {dep}")
+        # Kahn's algorithm to reject cycles before anything is launched
+        indegree = {tid: len(t.depends_on) for tid, t in tasks.items()}
+        ready = [tid for tid, d in indegree.items() if d == 0]
+        seen = 0
+        while ready:
+            tid = ready.pop()
+            seen += 1
+            for other in tasks.values():
+                if tid in other.depends_on:
+                    indegree[other.id] -= 1
+                    if indegree[other.id] == 0:
+                        ready.append(other.id)
+        if seen != len(tasks):
+            raise ValueError("Task graph contains a dependency cycle")
+
+    def _dependents(self, tasks: Dict[str, ScheduledTask], root: str) -> List[str]:
+        """Transitive dependents of `root`."""
+        found, frontier = [], [root]
+        while frontier:
+            current = frontier.pop()
+            for task in tasks.values():
+                if current in task.depends_on and task.id not in found:
+                    found.append(task.id)
+                    frontier.append(task.id)
+        return found
+
+    async def run(self, task_list: List[ScheduledTask]) -> Dict[str, Any]:
+        tasks = {task.id: task for task in task_list}
+        self._validate(tasks)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        origin = time.perf_counter()
+        done: Dict[str, asyncio.Event] = {tid: asyncio.Event() for tid in tasks}
+        handles: Dict[str, asyncio.Task] = {}
+
+        def cancel_downstream(root: str):
+            for tid in self._dependents(tasks, root):
+                task = tasks[tid]
+                if task.status in ("PENDING", "RUNNING"):
+                    task.status = "CANCELLED_BY_VETO"
+                    handles[tid].cancel()
+                    done[tid].set()
+                    self.on_event("CANCELLED", task)
+
+        async def execute(task: ScheduledTask):
+            try:
+                for dep in task.depends_on:
+                    await done[dep].wait()
+                if any(tasks[dep].status != "VERIFIED" for dep in task.depends_on):
+                    task.status = "CANCELLED_BY_VETO"
+                    return
+                async with semaphore:
+                    task.status = "RUNNING"
+                    task.started = time.perf_counter() - origin
+                    self.on_event("STARTED", task)
+                    result = await asyncio.to_thread(task.run)
+                    # The critic checks each result the moment it arrives
+                    accepted = task.preverified or await asyncio.to_thread(self.verify, result)
+                    task.finished = time.perf_counter() - origin
+                if accepted:
+                    task.artifact = result
+                    task.status = "VERIFIED"
+                    self.on_event("VERIFIED", task)
+                else:
+                    task.status = "ABORTED_BY_PHYSICS_VETO"
+                    self.on_event("VETOED", task)
+                    cancel_downstream(task.id)
+            except asyncio.CancelledError:
+                if task.status == "RUNNING":
+                    task.status = "CANCELLED_BY_VETO"
+            except Exception as e:
+                task.finished = time.perf_counter() - origin
+                task.status = "FAILED"
+                task.artifact = {"error": str(e)}
+                self.on_event("FAILED", task)
+                cancel_downstream(task.id)
+            finally:
+                done[task.id].set()
+
+        for task in task_list:
+            handles[task.id] = asyncio.create_task(execute(task))
+        await asyncio.gather(*handles.values(), return_exceptions=True)
+
+        wall_clock = time.perf_counter() - origin
+        return {
+            "wall_clock": wall_clock,
+            "tasks": tasks,
+            "timings": {tid: {"start": t.started, "end": t.finished, "duration": t.duration, "status": t.status}
+                        for tid, t in tasks.items()},
+            "critical_path": self.critical_path(tasks),
+        }
+
+    @staticmethod
+    def critical_path(tasks: Dict[str, ScheduledTask]) -> List[str]:
+        """
+        Walks back from the last task to finish, always following the dependency
+        that finished latest: the chain that bounded the mission's wall-clock.
+        """
+        finished = [t for t in tasks.values() if t.finished is not None]
+        if not finished:
+            return []
+        path = [max(finished, key=lambda t: t.finished)]
+        while True:
+            deps = [tasks[d] for d in path[-1].depends_on if tasks[d].finished is not None]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda t: t.finished))
+        return [t.id for t in reversed(path)]
+
+
+def run_dag(tasks: List[ScheduledTask], verify: Callable[[Any], bool], max_concurrency: int = 4,
+            on_event: Optional[Callable[[str, ScheduledTask], None]] = None) -> Dict[str, Any]:
+    """Synchronous entry point for callers outside an event loop."""
+    return asyncio.run(DependencyScheduler(verify, max_concurrency, on_event).run(tasks))
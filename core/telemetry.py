@@ -0,0 +1,317 @@
+"""
+BRAHAN_SEER OBSERVABILITY KERNEL: TELEMETRY v1.0
+Timing spans, counters and throughput gauges for the forensic kernels.
+Disabled by default: every hook is a single flag check until `enable()` is called.
+
+Environment switches (read once at import):
+  BRAHAN_TELEMETRY=1            record spans/counters/gauges for this process
+  BRAHAN_TELEMETRY_OUT=prefix   on exit write <prefix>.metrics.json and <prefix>.trace.json
+  BRAHAN_PROFILE=out.folded     sample the main thread for the whole run (folded stacks)
+"""
+
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+from collections import Counter
+from functools import wraps
+from contextlib import contextmanager
+
+MAX_SPANS = 200_000
+
+_enabled = False
+_lock = threading.Lock()
+_local = threading.local()
+_origin_ns = time.perf_counter_ns()
+
+_spans = []          # (name, start_ns, duration_ns, thread_id, depth, attrs)
+_dropped = 0
+_stats = {}          # name -> [count, total_ns, max_ns]
+_counters = Counter()
+_gauges = {}         # name -> last value
+_gauge_series = []   # (name, ts_ns, value) for the Chrome trace counter tracks
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Clears everything recorded so far (the enabled flag is left as is)."""
+    global _dropped
+    with _lock:
+        _spans.clear()
+        _stats.clear()
+        _counters.clear()
+        _gauges.clear()
+        _gauge_series.clear()
+        _dropped = 0
+
+
+def _record(name, start_ns, duration_ns, depth, attrs):
+    global _dropped
+    with _lock:
+        entry = _stats.get(name)
+        if entry is None:
+            _stats[name] = [1, duration_ns, duration_ns]
+        else:
+            entry[0] += 1
+            entry[1] += duration_ns
+            if duration_ns > entry[2]:
+                entry[2] = duration_ns
+        # Aggregates stay exact even once the raw span buffer is full
+        if len(_spans) < MAX_SPANS:
+            _spans.append((name, start_ns - _origin_ns, duration_ns, threading.get_ident(), depth, attrs))
+        else:
+            _dropped += 1
+
+
+class _Span:
+    __slots__ = ("name", "attrs", "start", "depth")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        depth = getattr(_local, "depth", 0)
+        _local.depth = depth + 1
+        self.depth = depth
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter_ns() - self.start
+        _local.depth = self.depth
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        _record(self.name, self.start, duration, self.depth, self.attrs)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, **attrs):
+    """Context manager timing a block. Returns a shared no-op object when disabled."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, attrs)
+
+
+def count(name, value=1):
+    if _enabled:
+        with _lock:
+            _counters[name] += value
+
+
+def gauge(name, value):
+    if _enabled:
+        with _lock:
+            _gauges[name] = value
+            _gauge_series.append((name, time.perf_counter_ns() - _origin_ns, value))
+
+
+def event(name, **attrs):
+    """Zero-duration marker (e.g. an agent log line) shown as an instant on the trace."""
+    if _enabled:
+        _record(name, time.perf_counter_ns(), 0, getattr(_local, "depth", 0), attrs)
+
+
+def instrument(name=None, samples=None):
+    """
+    Decorator recording a span per call. `samples(*args, **kwargs)` may return the
+    number of samples the call processes; it then feeds a `<name>.samples` counter
+    and a `<name>.samples_per_s` throughput gauge.
+    When telemetry is disabled the wrapper only adds a flag check to the call.
+    """
+    def decorator(fn):
+        label = name or fn.__qualname__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            try:
+                n = samples(*args, **kwargs) if samples is not None else None
+            except TypeError:  # e.g. a generator passed where a sized batch is usual
+                n = None
+            with _Span(label, {} if n is None else {"samples": n}) as active:
+                result = fn(*args, **kwargs)
+            if n:
+                duration_s = (time.perf_counter_ns() - active.start) / 1e9
+                count(f"{label}.samples", n)
+                if duration_s > 0:
+                    gauge(f"{label}.samples_per_s", n / duration_s)
+            return result
+        return wrapper
+    return decorator
+
+
+def summary():
+    """Per-span aggregates plus counters and gauges as a JSON-ready dict."""
+    with _lock:
+        durations = {}
+        for name, _, duration, _, _, _ in _spans:
+            durations.setdefault(name, []).append(duration)
+        spans = {}
+        for name, (calls, total, longest) in _stats.items():
+            ordered = sorted(durations.get(name, ()))
+            pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] / 1e6 if ordered else None
+            spans[name] = {
+                "count": calls,
+                "total_ms": total / 1e6,
+                "mean_ms": total / calls / 1e6,
+                "p50_ms": pick(0.50),
+                "p95_ms": pick(0.95),
+                "max_ms": longest / 1e6,
+            }
+        return {
+            "pid": os.getpid(),
+            "spans": spans,
+            "counters": dict(_counters),
+            "gauges": dict(_gauges),
+            "dropped_spans": _dropped,
+        }
+
+
+def export_json(path):
+    document = summary()
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, default=str)
+    return path
+
+
+def export_chrome_trace(path):
+    """Writes the Trace Event Format consumed by chrome://tracing and Perfetto."""
+    pid = os.getpid()
+    with _lock:
+        events = [{"name": name, "ph": "X" if duration else "i", "ts": start / 1e3, "dur": duration / 1e3,
+                   "pid": pid, "tid": tid, "args": attrs} for name, start, duration, tid, _, attrs in _spans]
+        events += [{"name": name, "ph": "C", "ts": ts / 1e3, "pid": pid, "args": {"value": value}}
+                   for name, ts, value in _gauge_series]
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+    return path
+
+
+class SamplingProfiler:
+    """
+    Opt-in wall-clock sampler: a background thread snapshots one thread's stack every
+    `interval` seconds and tallies folded stacks ("outer;inner;leaf count"), the input
+    format of flamegraph.pl and speedscope. Costs nothing unless started.
+    """
+    def __init__(self, interval=0.005, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self._sample, name="brahan-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self
+
+    def write_folded(self, path):
+        with open(path, "w") as f:
+            for stack, hits in self.stacks.most_common():
+                f.write(f"{stack} {hits}\n")
+        return path
+
+    def top(self, limit=10):
+        """Leaf frames ranked by sample count (self time)."""
+        leaves = Counter()
+        for stack, hits in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += hits
+        return leaves.most_common(limit)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+@contextmanager
+def profile_run(path, interval=0.005):
+    """Samples the calling thread for the duration of the block and writes folded stacks to `path`."""
+    profiler = SamplingProfiler(interval, threading.get_ident()).start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop().write_folded(path)
+
+
+def _configure_from_env():
+    if os.environ.get("BRAHAN_TELEMETRY", "").lower() in ("1", "true", "on"):
+        enable()
+    prefix = os.environ.get("BRAHAN_TELEMETRY_OUT")
+    if prefix:
+        enable()
+        atexit.register(lambda: (export_json(f"{prefix}.metrics.json"), export_chrome_trace(f"{prefix}.trace.json")))
+    folded = os.environ.get("BRAHAN_PROFILE")
+    if folded:
+        profiler = SamplingProfiler().start()
+        atexit.register(lambda: profiler.stop().write_folded(folded))
+
+
+_configure_from_env()
+
+
+if __name__ == "__main__":
+    enable()
+    with profile_run("/tmp/brahan_demo.folded") as profiler:
+        with span("demo.outer", wells=3):
+            for well in range(3):
+                with span("demo.inner", well=well):
+                    sum(i * i for i in range(200_000))
+                count("demo.wells")
+    print(json.dumps(summary(), indent=2))
+    print(f">>> PROFILER_TOP: {profiler.top(3)}")
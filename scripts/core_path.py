@@ -0,0 +1,12 @@
+"""
+BRAHAN_SEER SHARED KERNEL PATH
+Puts core/ (telemetry and the other shared kernels) on sys.path for the scripts/ modules.
+Import it explicitly, before any core/ module:  import core_path  # noqa: F401
+"""
+
+import os
+import sys
+
+CORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "core")
+if CORE_DIR not in sys.path:
+    sys.path.append(CORE_DIR)
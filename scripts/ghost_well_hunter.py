@@ -5,11 +5,39 @@ Objective: Identify the 153 Wells in Arrears (NSTA Jan 2026 Decommissioning Defi
 Compliance: EU AI Act Art 10 (Data Integrity) & Art 14 (Human-in-the-Loop)
 """
 
-import time
+import sys
 import json
 import random
+import argparse
 from datetime import datetime
 
+from well_registry import WellRegistry, compliance_verdict
+
+import core_path  # noqa: F401  (puts core/ on sys.path)
+import telemetry
+
+# Compiled once and reused for every alert; fields are filled from the structured record.
+ALERT_TEMPLATE = """
+>>> COMPLIANCE_ALERT: WELL_{uwi}
+STATUS: {status} // ARREARS: {arrears_days} DAYS
+COMPLIANCE_ENVELOPE: {compliance_envelope}
+
+FINDING:
+{risk_classification} DETECTED. Registry record for {uwi} is incomplete.
+Missing: {missing}.
+
+FORENSIC EVIDENCE:
+Scavenged via {source}. 
+Last recorded SITP: {sitp_scavenged}.
+Hardware status indicates subsea wellhead remains 'Live' despite topside removal.
+
+DIRECTIVE:
+Forensic re-validation and SME Notarization ({sme_notarization}) required before publication.
+Liability estimate for P&A deficit is UNMANAGED.
+"""
+
+_JSONL_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 class GhostWellHunter:
     def __init__(self):
         self.nsta_arrears_baseline = 153
@@ -53,52 +81,86 @@ class GhostWellHunter:
             "risk_classification": "DATA_ABYSS" if not is_compliant else "NOMINAL"
         }
 
+    def build_alert_record(self, well_record, forensic_data, compliance_data, region=None, asset=None):
+        """Structured alert record; one JSONL line in the alert stream."""
+        return {
+            "type": "COMPLIANCE_ALERT",
+            "uwi": well_record['uwi'],
+            "region": region,
+            "asset": asset,
+            "status": well_record['status'],
+            "arrears_days": well_record['arrearsDays'],
+            "compliance_envelope": self.compliance_standard,
+            "risk_classification": compliance_data['risk_classification'],
+            "violations": compliance_data['violations'],
+            "forensic": forensic_data,
+            "sme_notarization": self.sme_notarization_req,
+            "liability": "UNMANAGED"
+        }
+
+    def render_alert(self, record):
+        """Renders a structured alert record through the precompiled template."""
+        forensic = record['forensic']
+        return ALERT_TEMPLATE.format(
+            uwi=record['uwi'],
+            status=record['status'],
+            arrears_days=record['arrears_days'],
+            compliance_envelope=record['compliance_envelope'],
+            risk_classification=record['risk_classification'],
+            missing=', '.join(record['violations']),
+            source=forensic['source'],
+            sitp_scavenged=forensic['sitp_scavenged'],
+            sme_notarization=record['sme_notarization']
+        )
+
     def generate_compliance_alert(self, well_record, forensic_data, compliance_data):
         """
         Drafts a formal Compliance Alert for the website frontend.
         """
-        uwi = well_record['uwi']
-        alert = f"""
->>> COMPLIANCE_ALERT: WELL_{uwi}
-STATUS: {well_record['status']} // ARREARS: {well_record['arrearsDays']} DAYS
-COMPLIANCE_ENVELOPE: {self.compliance_standard}
+        return self.render_alert(self.build_alert_record(well_record, forensic_data, compliance_data))
 
-FINDING:
-{compliance_data['risk_classification']} DETECTED. Registry record for {uwi} is incomplete.
-Missing: {', '.join(compliance_data['violations'])}.
+    def stream_alerts(self, basin_data=None, registry=None):
+        """
+        Yields one structured alert record per arrears-critical well.
+        Nothing is accumulated, so peak memory is independent of the arrears count.
+        The registry is rebuilt from `basin_data` on every call. Callers that keep a
+        WellRegistry alive (built once, changed through `WellRegistry.upsert`) pass it
+        as `registry` instead to skip the rebuild.
+        """
+        # Indexed registry: arrears wells and compliance flags resolved as column checks
+        if registry is None:
+            registry = WellRegistry.from_basin_data(basin_data)
+        arrears_rows = registry.rows(registry.arrears_mask())
+        codes = registry.violation_codes(arrears_rows)
 
-FORENSIC EVIDENCE:
-Scavenged via {forensic_data['source']}. 
-Last recorded SITP: {forensic_data['sitp_scavenged']}.
-Hardware status indicates subsea wellhead remains 'Live' despite topside removal.
+        for row, code in zip(arrears_rows, codes):
+            well = registry.records[row]
+            region, asset = registry.labels(row)
+            forensic = self.scrape_unstructured_source(well['uwi'])
+            yield self.build_alert_record(well, forensic, compliance_verdict(code), region, asset)
 
-DIRECTIVE:
-Forensic re-validation and SME Notarization ({self.sme_notarization_req}) required before publication.
-Liability estimate for P&A deficit is UNMANAGED.
-"""
-        return alert
+    def write_alert_stream(self, basin_data, out, render_text=False, registry=None):
+        """
+        Writes the alert stream as JSONL to a file-like object, flushing per line so
+        downstream consumers (e.g. the BasinAudit.tsx feed) can render immediately.
+        Returns the number of alerts written.
+        """
+        count = 0
+        for record in self.stream_alerts(basin_data, registry):
+            if render_text:
+                record["alert"] = self.render_alert(record)
+            out.write(_JSONL_ENCODER.encode(record))
+            out.write("\n")
+            out.flush()
+            count += 1
+        return count
 
-    def run_mission(self, basin_data):
+    @telemetry.instrument("ghost_well.run_mission")
+    def run_mission(self, basin_data=None, registry=None):
         print(">>> INITIATING GHOST WELL HUNT: NSTA_DEFICIT_PROTOCOL")
-        time.sleep(1)
         
-        found_arrears = 0
-        alerts = []
-        
-        # Flatten basin data for search
-        all_wells = []
-        for region in basin_data:
-            for asset in region['assets']:
-                for profile in asset['riskProfiles']:
-                    all_wells.extend(profile['wells'])
-        
-        for well in all_wells:
-            if well['isArrearsCritical']:
-                found_arrears += 1
-                forensic = self.scrape_unstructured_source(well['uwi'])
-                compliance = self.evaluate_compliance(well)
-                alert = self.generate_compliance_alert(well, forensic, compliance)
-                alerts.append(alert)
+        alerts = [self.render_alert(record) for record in self.stream_alerts(basin_data, registry)]
+        telemetry.count("ghost_well.alerts", len(alerts))
                 
         print(f">>> HUNT_COMPLETE: Identified deficit wells against NSTA January 2026 Baseline.")
         print(f">>> ALERTS_DRAFTED: {len(alerts)}")
@@ -106,5 +168,22 @@ Liability estimate for P&A deficit is UNMANAGED.
 
 if __name__ == "__main__":
     # This logic is integrated into the BasinAudit.tsx component for the frontend display
+    parser = argparse.ArgumentParser(description='Ghost Well Hunter: streaming JSONL compliance alerts')
+    parser.add_argument('--basin', type=str, help='Path to basin audit JSON (BasinAuditNode[])')
+    parser.add_argument('--out', type=str, default='-', help='JSONL output path, or - for stdout')
+    parser.add_argument('--text', action='store_true', help='Include the rendered alert text in each record')
+    args = parser.parse_args()
+
     hunter = GhostWellHunter()
-    print("Kernel Logic Loaded.")
+    if not args.basin:
+        print("Kernel Logic Loaded.")
+        sys.exit(0)
+
+    with open(args.basin) as f:
+        basin = json.load(f)
+    if args.out == '-':
+        hunter.write_alert_stream(basin, sys.stdout, args.text)
+    else:
+        with open(args.out, 'w') as out:
+            written = hunter.write_alert_stream(basin, out, args.text)
+        print(f">>> ALERT_STREAM_COMMITTED: {written} records -> {args.out}", file=sys.stderr)
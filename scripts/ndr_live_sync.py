@@ -1,11 +1,15 @@
 
-import requests
 import json
 import time
 
+from ndr_scheduler import get_default_scheduler
+import core_path  # noqa: F401  (puts core/ on sys.path)
+import telemetry
+
 # BRAHAN_SEER LIVE_SYNC PROTOCOL v3.0
 # Lead Data Architect Auth: 0x88.777
 
+@telemetry.instrument("ndr.get_integrity_data")
 def get_ndr_integrity_data(well_name, api_key):
     """
     Connects to the Live NSTA NDR ODATA API.
@@ -25,7 +29,8 @@ def get_ndr_integrity_data(well_name, api_key):
     try:
         # Step 1: Query Well Header (Planned vs Actual TD, Geodetic Datum)
         header_url = f"{base_url}/WellHeaders?$filter={odata_filter}"
-        response = requests.get(header_url, headers=headers, timeout=10)
+        scheduler = get_default_scheduler()
+        response = scheduler.get(header_url, headers=headers, timeout=10)
         
         if response.status_code == 403:
             return {"status": "ERROR", "code": 403, "msg": "AUTH_REFUSED: Invalid API Key"}
@@ -37,7 +42,7 @@ def get_ndr_integrity_data(well_name, api_key):
 
         # Step 2: Query Casing Tally (Material Grade, Connections)
         casing_url = f"{base_url}/CasingStrings?$filter={odata_filter}"
-        casing_response = requests.get(casing_url, headers=headers, timeout=10)
+        casing_response = scheduler.get(casing_url, headers=headers, timeout=10)
         casing_data = casing_response.json().get('value', [{}])
 
         # Step 3: Align and Map to Sovereign_Ledger Schema
@@ -67,6 +72,16 @@ def get_ndr_integrity_data(well_name, api_key):
     except Exception as e:
         return {"status": "CRASH", "msg": str(e)}
 
+@telemetry.instrument("ndr.harvest_integrity_data", samples=lambda names, key: len(names))
+def harvest_ndr_integrity_data(well_names, api_key):
+    """
+    Fans out get_ndr_integrity_data over many wells through the shared scheduler.
+    Results are returned in the same order as `well_names`.
+    """
+    scheduler = get_default_scheduler()
+    return scheduler.map(lambda name: get_ndr_integrity_data(name, api_key), well_names)
+
 # Execution Pattern:
 # results = get_ndr_integrity_data("Harris H1", "NDR_API_KEY_MASKED")
 # print(json.dumps(results, indent=2))
+# fleet = harvest_ndr_integrity_data(["Harris H1", "Heather H12"], "NDR_API_KEY_MASKED")
@@ -2,11 +2,16 @@
 import requests
 import json
 
+from ndr_scheduler import get_default_scheduler
+import core_path  # noqa: F401  (puts core/ on sys.path)
+import telemetry
+
 # NDR_ENGINEERING_PROTOCOL v2.1
 # Auth: Sovereign Data Engineer
 NDR_API_KEY = "YOUR_NDR_API_KEY_HERE"
 BASE_URL = "https://ndr.nstauthority.co.uk/api/v1"
 
+@telemetry.instrument("ndr.fetch_well_artifact")
 def fetch_well_artifact(well_identifier):
     """
     Ingests well-header and casing data from NSTA NDR.
@@ -22,7 +27,7 @@ def fetch_well_artifact(well_identifier):
     params = {"query": well_identifier}
     
     try:
-        response = requests.get(f"{BASE_URL}/wells/header", params=params, headers=headers)
+        response = get_default_scheduler().get(f"{BASE_URL}/wells/header", params=params, headers=headers)
         
         if response.status_code == 403:
             return {"error": "403_FORBIDDEN: Invalid NDR_API_KEY or expired session."}
@@ -48,6 +53,11 @@ def fetch_well_artifact(well_identifier):
     except requests.exceptions.RequestException as e:
         return {"error": f"SYSTEM_CRASH: {str(e)}"}
 
+@telemetry.instrument("ndr.fetch_well_artifacts", samples=lambda ids: len(ids))
+def fetch_well_artifacts(well_identifiers):
+    """Batch variant of fetch_well_artifact, paced by the shared NDR scheduler."""
+    return get_default_scheduler().map(fetch_well_artifact, well_identifiers)
+
 # Example Usage:
 # harris_data = fetch_well_artifact("Harris H1")
 # print(json.dumps(harris_data, indent=2))
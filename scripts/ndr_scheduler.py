@@ -0,0 +1,292 @@
+"""
+BRAHAN_SEER HARVEST PROTOCOL: NDR_REQUEST_SCHEDULER v1.0
+Shared rate-limited request scheduler for the NSTA NDR clients.
+Token bucket pacing + AIMD adaptive concurrency + jittered retries + circuit breaker.
+"Harvest at the limit. Never past it."
+"""
+
+import time
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import core_path  # noqa: F401  (puts core/ on sys.path)
+import telemetry
+
+# Status codes that indicate throttling or a transient upstream fault.
+# 403/404 are terminal for the NDR clients and are never retried.
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised when the breaker is open and the request was not attempted."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    rate: sustained requests per second. capacity: maximum burst size.
+    The rate can be adjusted at runtime by the scheduler.
+    """
+    def __init__(self, rate=10.0, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def set_rate(self, rate):
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+    def acquire(self):
+        """Blocks until one token is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency gate.
+    Additive increase (+1 per `limit` successes), multiplicative decrease on throttling.
+    """
+    def __init__(self, initial=4, minimum=1, maximum=32, decrease_factor=0.5):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self.cond = threading.Condition()
+
+    def acquire(self):
+        with self.cond:
+            while self.in_flight >= int(self.limit):
+                self.cond.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self.cond:
+            self.in_flight -= 1
+            self.cond.notify()
+
+    def on_success(self):
+        with self.cond:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+            self.cond.notify_all()
+
+    def on_throttle(self):
+        with self.cond:
+            self.limit = max(self.minimum, self.limit * self.decrease_factor)
+
+
+class CircuitBreaker:
+    """
+    Three-state breaker: CLOSED -> OPEN after `failure_threshold` consecutive failures,
+    OPEN -> HALF_OPEN after `reset_timeout` seconds, HALF_OPEN admits a single probe.
+    """
+    def __init__(self, failure_threshold=5, reset_timeout=10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "CLOSED"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        with self.lock:
+            if self.state == "OPEN":
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = "HALF_OPEN"
+                self.probe_in_flight = False
+            if self.state == "HALF_OPEN":
+                if self.probe_in_flight:
+                    return False
+                self.probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self.lock:
+            self.state = "CLOSED"
+            self.failures = 0
+            self.probe_in_flight = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == "HALF_OPEN" or self.failures >= self.failure_threshold:
+                self.state = "OPEN"
+                self.opened_at = time.monotonic()
+            self.probe_in_flight = False
+
+
+class NDRRequestScheduler:
+    """
+    Paces every NDR call through a shared token bucket and adaptive concurrency gate.
+    On 429/5xx the request rate and concurrency back off multiplicatively, at most once
+    per `throttle_cooldown` seconds. While requests succeed the rate probes back up
+    towards `max_rate` additively, by `increase_step` x max_rate once per window.
+    """
+    def __init__(self, max_rate=10.0, burst=None, initial_concurrency=4, max_concurrency=16,
+                 max_retries=4, backoff_base=0.25, backoff_cap=8.0,
+                 failure_threshold=5, reset_timeout=10.0, throttle_cooldown=1.0,
+                 increase_step=0.1, session=None):
+        self.max_rate = float(max_rate)
+        self.min_rate = max(0.5, self.max_rate * 0.05)
+        self.bucket = TokenBucket(max_rate, burst)
+        self.limiter = AdaptiveConcurrencyLimiter(initial_concurrency, 1, max_concurrency)
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.throttle_cooldown = throttle_cooldown
+        self.increase_step = increase_step
+        self.last_decrease = float("-inf")
+        self.last_increase = float("-inf")
+        self.throttle_lock = threading.Lock()
+        self.session = session or requests.Session()
+        self.stats = {"requests": 0, "success": 0, "throttled": 0, "retries": 0,
+                      "errors": 0, "short_circuited": 0, "decreases": 0}
+        self.stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def _backoff(self, attempt, retry_after=None):
+        """Full-jitter exponential backoff, floored by any server Retry-After hint."""
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        time.sleep(delay)
+
+    def _on_throttle(self):
+        # Every request in flight during an overload sees the same 429 burst; treat the
+        # burst as one congestion signal so rate and concurrency are halved only once.
+        with self.throttle_lock:
+            now = time.monotonic()
+            if now - self.last_decrease < self.throttle_cooldown:
+                return
+            self.last_decrease = now
+        self.limiter.on_throttle()
+        self.bucket.set_rate(max(self.min_rate, self.bucket.rate * 0.5))
+        self._count("decreases")
+
+    def _on_success(self):
+        self.limiter.on_success()
+        if self.bucket.rate >= self.max_rate:
+            return
+        # Additive increase per window, not per success: at tens of requests per second a
+        # per-success step undoes a halving within a second and re-triggers the 429 burst.
+        with self.throttle_lock:
+            now = time.monotonic()
+            if now - max(self.last_increase, self.last_decrease) < self.throttle_cooldown:
+                return
+            self.last_increase = now
+        self.bucket.set_rate(min(self.max_rate, self.bucket.rate + self.increase_step * self.max_rate))
+
+    @staticmethod
+    def _retry_after(response):
+        value = response.headers.get("Retry-After")
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+
+    def request(self, method, url, **kwargs):
+        """
+        Issues a single request with pacing, retries and breaker protection.
+        Returns the final requests.Response (which may still carry a 429/5xx once
+        retries are exhausted). Raises CircuitOpenError or the last transport error.
+        """
+        with telemetry.span("ndr.request", method=method) as active:
+            response = self._request(method, url, kwargs, active)
+            active.set(status=response.status_code)
+            return response
+
+    def _request(self, method, url, kwargs, active):
+        kwargs.setdefault("timeout", 10)
+        last_exc = None
+        response = None
+
+        for attempt in range(self.max_retries + 1):
+            active.set(attempts=attempt + 1)
+            if not self.breaker.allow():
+                self._count("short_circuited")
+                telemetry.count("ndr.short_circuited")
+                raise CircuitOpenError(f"CIRCUIT_OPEN: NDR upstream unhealthy, refused {url}")
+
+            self.bucket.acquire()
+            self.limiter.acquire()
+            self._count("requests")
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                last_exc = e
+                response = None
+            finally:
+                self.limiter.release()
+
+            if response is not None and response.status_code not in RETRYABLE_STATUS:
+                self.breaker.record_success()
+                self._on_success()
+                self._count("success")
+                telemetry.count("ndr.success")
+                return response
+
+            # Throttled, upstream fault or transport error. A 429 means the upstream is
+            # healthy but pacing us, so only 5xx and transport errors count towards the breaker.
+            if response is None or response.status_code != 429:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            self._on_throttle()
+            self._count("throttled" if response is not None else "errors")
+            telemetry.count("ndr.throttled" if response is not None else "ndr.errors")
+            if attempt == self.max_retries:
+                break
+            self._count("retries")
+            self._backoff(attempt, self._retry_after(response) if response is not None else None)
+
+        if response is not None:
+            return response
+        raise last_exc
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def map(self, fn, items):
+        """
+        Runs `fn(item)` for every item on a worker pool sized to the concurrency ceiling.
+        `fn` is expected to issue its calls through this scheduler; ordering is preserved.
+        """
+        with ThreadPoolExecutor(max_workers=self.limiter.maximum) as pool:
+            return list(pool.map(fn, items))
+
+
+_default_scheduler = None
+_default_lock = threading.Lock()
+
+
+def get_default_scheduler():
+    """Process-wide scheduler shared by ndr_live_sync and ndr_retrieval."""
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = NDRRequestScheduler()
+        return _default_scheduler
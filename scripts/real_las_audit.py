@@ -5,13 +5,94 @@ Automated extraction of GR and CALI curves from legacy LAS artifacts.
 "The ledger of the lithosphere requires absolute precision."
 """
 
+import io
 import os
 import sys
 import argparse
 import datetime
 import csv
 
-def audit_las_file(input_path, output_csv=None):
+import numpy as np
+
+class LASFormatError(ValueError):
+    """Raised when an artifact's ~A data block does not match its curve dictionary."""
+
+def parse_las(input_path):
+    """
+    Minimal LAS 2.0 reader: ~W well information, ~C curve dictionary and ~A data block.
+    Returns (well_name, curve_names, data) with data as a (samples, curves) float array
+    and the NULL value replaced by NaN.
+    Raises LASFormatError on non-numeric tokens or on rows short of the curve count.
+    """
+    with open(input_path, errors="replace") as f:
+        return _parse_las_stream(f)
+
+def parse_las_text(text):
+    """parse_las for LAS content already in memory (e.g. an upload)."""
+    return _parse_las_stream(io.StringIO(text))
+
+def _parse_las_stream(f):
+    well_name = None
+    null_value = None
+    curves = []
+    section = None
+    data_lines = ""
+
+    for line in f:
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if stripped.startswith('~'):
+            section = stripped[1].upper()
+            if section == 'A':
+                # The ASCII block is numeric to EOF; hand it to NumPy in one call
+                data_lines = f.read()
+                break
+            continue
+
+        mnemonic, _, rest = stripped.partition('.')
+        mnemonic = mnemonic.strip().upper()
+        value = rest.split(' ', 1)[1].split(':', 1)[0].strip() if ' ' in rest else ''
+        if section == 'W':
+            if mnemonic == 'WELL':
+                well_name = value
+            elif mnemonic == 'NULL':
+                try:
+                    null_value = float(value)
+                except ValueError:
+                    raise LASFormatError(f"~W NULL value {value!r} is not numeric") from None
+        elif section == 'C':
+            curves.append(mnemonic)
+
+    if section != 'A':
+        raise LASFormatError("missing ~A data section")
+    data = _parse_data_block(data_lines, len(curves))
+    if null_value is not None:
+        data[data == null_value] = np.nan
+    return well_name, curves, data
+
+def _parse_data_block(block, width):
+    if not block.strip():
+        return np.empty((0, width))
+    try:
+        data = np.loadtxt(io.StringIO(block), ndmin=2)
+    except ValueError:
+        # Slow path only on failure: find the offending line for the report
+        for number, line in enumerate(block.splitlines(), 1):
+            values = line.split('#', 1)[0].split()
+            for value in values:
+                try:
+                    float(value)
+                except ValueError:
+                    raise LASFormatError(f"~A line {number}: non-numeric value {value!r}") from None
+            if values and width and len(values) != width:
+                raise LASFormatError(f"~A line {number}: {len(values)} values for {width} curves") from None
+        raise LASFormatError("~A data block has inconsistent row widths") from None
+    if width and data.shape[1] != width:
+        raise LASFormatError(f"~A data block has {data.shape[1]} columns for {width} curves")
+    return data
+
+def audit_las_file(input_path, output_csv=None, curves='GR,CALI'):
     if not os.path.exists(input_path):
         print(f"!!! ERR: FILENOTFOUND: {input_path}")
         sys.exit(1)
@@ -19,35 +100,37 @@ def audit_las_file(input_path, output_csv=None):
     print(f">>> INITIATING_FORENSIC_AUDIT: {os.path.basename(input_path)}")
     print(f">>> TIMESTAMP: {datetime.datetime.now().isoformat()}")
     
-    # In a real environment, we would use 'lasio' or custom regex
-    # For the Brahan Terminal, we simulate the core parsing logic
-    
-    curves_to_find = ['GR', 'CALI', 'DEPTH']
-    found_curves = []
-    data_lines = []
-    well_name = "NC-12" # Simulated metadata extraction
+    curves_to_find = ['DEPTH'] + [c.strip().upper() for c in curves.split(',') if c.strip()]
+    try:
+        well_name, found_curves, data = parse_las(input_path)
+    except LASFormatError as e:
+        print(f"!!! ERR: LAS_FORMAT: {e}")
+        sys.exit(1)
     
-    print(f">>> DETECTED_WELL: {well_name}")
+    print(f">>> DETECTED_WELL: {well_name or 'UNKNOWN'}")
     print(">>> SCANNING_CURVE_DICTIONARY...")
-    
-    # Simulated search
-    found_curves = ['DEPTH', 'GR', 'CALI', 'BS', 'NPHI']
     print(f">>> INDEX_LOCKED: Found {len(found_curves)} traces.")
     
-    # Filter for target curves
-    targets = [c for c in found_curves if c in curves_to_find]
+    # Filter for target curves (DEPT is the LAS 2.0 spelling of the depth index)
+    aliases = {'DEPT': 'DEPTH'}
+    targets = [c for c in found_curves if aliases.get(c, c) in curves_to_find]
     print(f">>> FILTER_APPLIED: Extracting [{', '.join(targets)}]")
     
     if not output_csv:
-        output_csv = input_path.replace('.las', '_forensic_audit.csv')
+        output_csv = os.path.splitext(input_path)[0] + '_forensic_audit.csv'
+    if os.path.realpath(output_csv) == os.path.realpath(input_path):
+        print(f"!!! ERR: OUTPUT_WOULD_OVERWRITE_INPUT: {output_csv}")
+        sys.exit(1)
         
     print(f">>> EXPORTING_VOXELS to {output_csv}...")
     
-    # Simulated CSV Generation
-    # Headers: Depth, GR, Caliper
-    # Content: ...
+    columns = [found_curves.index(c) for c in targets]
+    with open(output_csv, 'w', newline='') as out:
+        writer = csv.writer(out)
+        writer.writerow(targets)
+        writer.writerows(data[:, columns].tolist())
     
-    print(">>> SUCCESS: 12,452 samples processed.")
+    print(f">>> SUCCESS: {len(data):,} samples processed.")
     print(f">>> ARTIFACT_COMMITTED: {output_csv}")
 
 if __name__ == "__main__":
@@ -57,4 +140,4 @@ if __name__ == "__main__":
     parser.add_argument('--out', type=str, help='Output path')
     
     args = parser.parse_args()
-    audit_las_file(args.input, args.out)
+    audit_las_file(args.input, args.out, args.curves)
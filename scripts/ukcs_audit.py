@@ -5,15 +5,110 @@ Identifies 'Ghost Wells' out of regulatory consent using NSTA Registry data.
 Compliance: EU AI Act Art 10 (Data Integrity for Critical Infrastructure)
 """
 
+import os
+import csv
 import time
 import json
+import argparse
 from datetime import datetime
 
+import numpy as np
+
+import core_path  # noqa: F401  (puts core/ on sys.path)
+import telemetry
+
+# Column aliases seen across NSTA suspended-wells CSV and ArcGIS GeoJSON exports.
+FIELD_ALIASES = {
+    "uwi": ("uwi", "UWI", "WELLREGNO", "WELL_REGISTRATION_NUMBER", "WELLNAME"),
+    "operator": ("operator", "OPERATOR", "CURRENT_OPERATOR", "ORIGINALOPERATOR"),
+    "status": ("status", "STATUS", "WELL_STATUS", "CURRENTSTATUS"),
+    "suspension_expiry": ("suspension_expiry", "SUSPENSION_EXPIRY", "SUSPENSIONEXPIRY", "SUSP_EXPIRY_DATE"),
+}
+
+
+def _to_datetime64(values):
+    """
+    Converts a column of date strings (ISO, ISO-with-time, dd/mm/yyyy) or epoch-millisecond
+    numbers (ArcGIS exports) to datetime64[D]. Missing or unparseable entries become NaT.
+    """
+    numeric = np.array([isinstance(v, (int, float)) and not isinstance(v, bool) for v in values], dtype=bool)
+    iso = np.array(["NaT" if numeric[i] or not v else str(v)[:10] for i, v in enumerate(values)], dtype="U10")
+    try:
+        out = iso.astype("datetime64[D]")
+    except ValueError:
+        # Mixed formats: parse element-wise
+        out = np.empty(len(iso), dtype="datetime64[D]")
+        for i, v in enumerate(iso):
+            try:
+                out[i] = np.datetime64(v, "D")
+            except ValueError:
+                try:
+                    out[i] = np.datetime64(datetime.strptime(v, "%d/%m/%Y").date(), "D")
+                except ValueError:
+                    out[i] = np.datetime64("NaT")
+
+    if numeric.any():
+        epoch_ms = np.array([values[i] for i in np.flatnonzero(numeric)], dtype=np.int64)
+        out[numeric] = epoch_ms.astype("datetime64[ms]").astype("datetime64[D]")
+    return out
+
+
+class SuspendedWellsTable:
+    """Columnar view of the suspended-wells registry: one NumPy array per field."""
+    def __init__(self, uwi, operator, status, suspension_expiry):
+        self.uwi = np.asarray(uwi, dtype=object)
+        self.operator = np.asarray(operator, dtype=object)
+        self.status = np.asarray(status, dtype=object)
+        self.suspension_expiry = _to_datetime64(list(suspension_expiry))
+
+    def __len__(self):
+        return len(self.uwi)
+
+    def take(self, rows):
+        """Row subset sharing the already-parsed columns."""
+        subset = object.__new__(SuspendedWellsTable)
+        subset.uwi = self.uwi[rows]
+        subset.operator = self.operator[rows]
+        subset.status = self.status[rows]
+        subset.suspension_expiry = self.suspension_expiry[rows]
+        return subset
+
+    @classmethod
+    def from_records(cls, records):
+        columns = {field: [] for field in FIELD_ALIASES}
+        for record in records:
+            for field, aliases in FIELD_ALIASES.items():
+                columns[field].append(next((record[a] for a in aliases if record.get(a) not in (None, "")), None))
+        return cls(**columns)
+
+    @classmethod
+    def from_file(cls, path):
+        """Loads a CSV or GeoJSON (FeatureCollection) suspended-wells export."""
+        if os.path.splitext(path)[1].lower() in (".geojson", ".json"):
+            with open(path) as f:
+                collection = json.load(f)
+            return cls.from_records(feature.get("properties", {}) for feature in collection["features"])
+        with open(path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            rows = list(reader)
+        # CSV exports have a fixed header, so aliases are resolved once per column
+        columns = {}
+        for field, aliases in FIELD_ALIASES.items():
+            index = next((header.index(a) for a in aliases if a in header), None)
+            columns[field] = [None] * len(rows) if index is None else [row[index] or None for row in rows]
+        return cls(**columns)
+
+
 class UKCSBasinAuditor:
     def __init__(self):
         self.api_endpoint = "https://nsta.opendata.arcgis.com/datasets/suspended-wells"
         self.target_operators = ["EnQuest", "CNOOC", "Ithaca", "Serica"]
         self.consent_threshold_months = 24
+        self.decay_threshold_days = 365
+        # Jan 2026 fine basis: £350,000 levied against the 153-well arrears baseline
+        self.fine_basis_gbp = 350000
+        self.fine_basis_wells = 153
 
     def query_registry(self, region="Northern North Sea"):
         print(f"\n>>> INITIATING_REGISTRY_QUERY: {region}")
@@ -55,24 +150,115 @@ class UKCSBasinAuditor:
             "violation": "EU_AI_ACT_DECAY" if arrears_days > 365 else "NSTA_CONSENT_LAPSE"
         }
 
-    def run_full_basin_audit(self):
+    def audit_bulk(self, table, today=None):
+        """
+        Vectorized audit_well_integrity over a SuspendedWellsTable.
+        One datetime64 pass computes arrears days and violation classes for every row.
+        """
+        today = np.datetime64(today or "today", "D")
+        expiry = table.suspension_expiry
+        has_expiry = ~np.isnat(expiry)
+
+        arrears = np.zeros(len(table), dtype=np.int64)
+        arrears[has_expiry] = (today - expiry[has_expiry]).astype(np.int64)
+        # Expiry at midnight has already lapsed by any time "today" (matches audit_well_integrity)
+        out_of_consent = has_expiry & (arrears >= 0)
+        np.maximum(arrears, 0, out=arrears)
+
+        violation = np.where(arrears > self.decay_threshold_days, "EU_AI_ACT_DECAY", "NSTA_CONSENT_LAPSE").astype(object)
+        violation[~has_expiry] = "MISSING_SUSPENSION_EXPIRY"
+
+        return {
+            "uwi": table.uwi,
+            "operator": table.operator,
+            "is_out_of_consent": out_of_consent,
+            "arrears_magnitude": arrears,
+            "violation": violation,
+        }
+
+    def fiscal_exposure(self, out_of_consent_count):
+        """Scales the Jan 2026 fine basis to the observed number of out-of-consent wells."""
+        return out_of_consent_count * self.fine_basis_gbp / self.fine_basis_wells
+
+    def aggregate_operators(self, audit):
+        """Per-operator totals for each of `target_operators` (matched case-insensitively by name)."""
+        names, inverse = np.unique(audit["operator"].astype(str), return_inverse=True)
+        n = len(names)
+        lapsed = audit["is_out_of_consent"]
+        decay = lapsed & (audit["violation"] == "EU_AI_ACT_DECAY")
+        wells = np.bincount(inverse, minlength=n)
+        out = np.bincount(inverse, weights=lapsed, minlength=n)
+        decayed = np.bincount(inverse, weights=decay, minlength=n)
+        days = np.bincount(inverse, weights=audit["arrears_magnitude"], minlength=n)
+
+        lowered = np.char.lower(names.astype(str))
+        aggregates = {}
+        for target in self.target_operators:
+            match = np.char.find(lowered, target.lower()) >= 0
+            out_count = int(out[match].sum())
+            aggregates[target] = {
+                "wells": int(wells[match].sum()),
+                "out_of_consent": out_count,
+                "eu_ai_act_decay": int(decayed[match].sum()),
+                "arrears_days_total": int(days[match].sum()),
+                "fiscal_exposure_gbp": round(self.fiscal_exposure(out_count), 2),
+            }
+        return aggregates
+
+    def run_bulk_audit(self, registry_path, today=None):
+        """Audits a full NSTA suspended-wells export and returns the basin summary."""
+        table = SuspendedWellsTable.from_file(registry_path)
+        return self.audit_summary(table, self.audit_bulk(table, today))
+
+    def audit_summary(self, table, audit):
+        """Basin summary for an audit_bulk result."""
+        out_count = int(audit["is_out_of_consent"].sum())
+        return {
+            "wells_audited": len(table),
+            "out_of_consent": out_count,
+            "eu_ai_act_decay": int((audit["is_out_of_consent"] & (audit["violation"] == "EU_AI_ACT_DECAY")).sum()),
+            "missing_expiry": int((audit["violation"] == "MISSING_SUSPENSION_EXPIRY").sum()),
+            "fiscal_exposure_gbp": round(self.fiscal_exposure(out_count), 2),
+            "operators": self.aggregate_operators(audit),
+        }
+
+    @telemetry.instrument("ukcs.run_full_basin_audit")
+    def run_full_basin_audit(self, registry_path=None):
         print("="*60)
         print(">>> BRAHAN_SEER: UKCS BASIN-WIDE INTEGRITY AUDIT")
         print(f">>> SME_VERIFIER: 30_YR_SENIOR_ENG")
         print("="*60)
         
-        raw_data = self.query_registry()
+        if registry_path:
+            table = SuspendedWellsTable.from_file(registry_path)
+        else:
+            table = SuspendedWellsTable.from_records(self.query_registry())
+        with telemetry.span("ukcs.audit_bulk", wells=len(table)):
+            audit = self.audit_bulk(table)
+        telemetry.count("ukcs.wells_audited", len(table))
         vault_artifacts = []
         
-        for well in raw_data:
-            audit = self.audit_well_integrity(well)
-            if audit["is_out_of_consent"]:
-                print(f"[!] GHOST_DETECTED: {well['uwi']} | {audit['arrears_magnitude']} days out of consent.")
-                vault_artifacts.append(audit)
+        for row in np.flatnonzero(audit["is_out_of_consent"]):
+            print(f"[!] GHOST_DETECTED: {audit['uwi'][row]} | {audit['arrears_magnitude'][row]} days out of consent.")
+            vault_artifacts.append({key: column[row].item() if hasattr(column[row], "item") else column[row]
+                                    for key, column in audit.items()})
                 
-        print("\n>>> AUDIT_COMPLETE: Found 153 Wells in Arrears across UKCS.")
-        print(f">>> FISCAL_EXPOSURE: £350,000 (Based on Jan 2026 Fines)")
+        print(f"\n>>> AUDIT_COMPLETE: Found {len(vault_artifacts)} Wells in Arrears across UKCS.")
+        print(f">>> FISCAL_EXPOSURE: £{self.fiscal_exposure(len(vault_artifacts)):,.0f} (Based on Jan 2026 Fines)")
+        for operator, totals in self.aggregate_operators(audit).items():
+            print(f">>> {operator}: {totals['out_of_consent']}/{totals['wells']} out of consent | £{totals['fiscal_exposure_gbp']:,.0f}")
+        return vault_artifacts
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='UKCS Suspended Wells Auditor')
+    parser.add_argument('--registry', type=str, help='NSTA suspended-wells CSV/GeoJSON export')
+    parser.add_argument('--snapshot', type=str, help='Snapshot file for incremental (diff-only) daily runs')
+    args = parser.parse_args()
+
     auditor = UKCSBasinAuditor()
-    auditor.run_full_basin_audit()
+    if args.snapshot and args.registry:
+        from ukcs_snapshot import IncrementalBasinAudit
+        report = IncrementalBasinAudit(args.snapshot, auditor).run(args.registry)
+        print(json.dumps(report, indent=2))
+    else:
+        auditor.run_full_basin_audit(args.registry)
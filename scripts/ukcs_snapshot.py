@@ -0,0 +1,164 @@
+"""
+BRAHAN_SEER FORENSIC TOOLKIT: UKCS_SNAPSHOT_DIFF
+Incremental basin audit. Persists the last audited registry state keyed by UWI and
+re-evaluates only the rows that changed, or crossed an expiry boundary, since the last run.
+"""
+
+import os
+import hashlib
+
+import numpy as np
+
+from ukcs_audit import UKCSBasinAuditor, SuspendedWellsTable
+
+# Per-well audit state persisted in the snapshot
+STATE_IN_CONSENT = 0
+STATE_CONSENT_LAPSE = 1    # NSTA_CONSENT_LAPSE
+STATE_DECAY = 2            # EU_AI_ACT_DECAY
+STATE_MISSING_EXPIRY = 3   # MISSING_SUSPENSION_EXPIRY
+STATE_LABELS = ("IN_CONSENT", "NSTA_CONSENT_LAPSE", "EU_AI_ACT_DECAY", "MISSING_SUSPENSION_EXPIRY")
+
+
+def row_hashes(table):
+    """64-bit content hash per registry row (uwi, operator, status, expiry)."""
+    hashes = np.empty(len(table), dtype=np.uint64)
+    expiry = table.suspension_expiry.astype(str)
+    for i, fields in enumerate(zip(table.uwi, table.operator, table.status, expiry)):
+        digest = hashlib.blake2b("\x1f".join(map(str, fields)).encode(), digest_size=8).digest()
+        hashes[i] = int.from_bytes(digest, "little")
+    return hashes
+
+
+def audit_states(audit):
+    """Collapses an audit_bulk result into STATE_* codes."""
+    state = np.full(len(audit["uwi"]), STATE_IN_CONSENT, dtype=np.int8)
+    state[audit["is_out_of_consent"]] = STATE_CONSENT_LAPSE
+    state[audit["is_out_of_consent"] & (audit["violation"] == "EU_AI_ACT_DECAY")] = STATE_DECAY
+    state[audit["violation"] == "MISSING_SUSPENSION_EXPIRY"] = STATE_MISSING_EXPIRY
+    return state
+
+
+class AuditSnapshot:
+    """Sorted-by-UWI columnar snapshot of one audit run, stored as a compressed .npz."""
+    def __init__(self, uwi, row_hash, expiry, state, audit_date):
+        order = np.argsort(uwi, kind="stable")
+        self.uwi = np.asarray(uwi, dtype=str)[order]
+        self.row_hash = np.asarray(row_hash, dtype=np.uint64)[order]
+        self.expiry = np.asarray(expiry, dtype="datetime64[D]")[order]
+        self.state = np.asarray(state, dtype=np.int8)[order]
+        self.audit_date = np.datetime64(audit_date, "D")
+
+    def __len__(self):
+        return len(self.uwi)
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["uwi"], data["row_hash"], data["expiry"], data["state"], data["audit_date"][()])
+
+    def save(self, path):
+        tmp_path = path + ".tmp.npz"
+        np.savez_compressed(tmp_path, uwi=self.uwi, row_hash=self.row_hash, expiry=self.expiry,
+                            state=self.state, audit_date=np.array(self.audit_date))
+        os.replace(tmp_path, path)
+
+    def lookup(self, uwi):
+        """Snapshot row index for each UWI, -1 where the well is unknown."""
+        uwi = np.asarray(uwi, dtype=str)
+        if not len(self.uwi):
+            return np.full(len(uwi), -1, dtype=np.int64)
+        pos = np.searchsorted(self.uwi, uwi)
+        pos_clipped = np.minimum(pos, len(self.uwi) - 1)
+        return np.where(self.uwi[pos_clipped] == uwi, pos_clipped, -1)
+
+
+class IncrementalBasinAudit:
+    """
+    Daily snapshot-diff driver around UKCSBasinAuditor.
+    Only added, changed, and boundary-crossing wells go through audit_bulk; everything else
+    carries its state forward from the previous snapshot.
+    """
+    def __init__(self, snapshot_path, auditor=None):
+        self.snapshot_path = snapshot_path
+        self.auditor = auditor or UKCSBasinAuditor()
+
+    def _crossed_boundary(self, expiry, since, today):
+        """Wells whose lapse or decay date fell in (since, today]."""
+        decay = self.auditor.decay_threshold_days
+        valid = ~np.isnat(expiry)
+        lapse_cross = valid & (expiry > since) & (expiry <= today)
+        decay_date = expiry + np.timedelta64(decay + 1, "D")
+        decay_cross = valid & (decay_date > since) & (decay_date <= today)
+        return lapse_cross | decay_cross
+
+    def run(self, registry_path, today=None):
+        today = np.datetime64(today or "today", "D")
+        table = SuspendedWellsTable.from_file(registry_path)
+        hashes = row_hashes(table)
+        previous = AuditSnapshot.load(self.snapshot_path)
+
+        if previous is None:
+            prev_idx = np.full(len(table), -1, dtype=np.int64)
+            prev_state = np.full(len(table), -1, dtype=np.int8)
+            removed_uwi = np.array([], dtype=str)
+            removed_state = np.array([], dtype=np.int8)
+            since = today
+        else:
+            prev_idx = previous.lookup(table.uwi)
+            known = prev_idx >= 0
+            prev_state = np.where(known, previous.state[np.maximum(prev_idx, 0)], -1).astype(np.int8)
+            seen = np.zeros(len(previous), dtype=bool)
+            seen[prev_idx[known]] = True
+            removed_uwi = previous.uwi[~seen]
+            removed_state = previous.state[~seen]
+            since = previous.audit_date
+
+        added = prev_idx < 0
+        if previous is None:
+            changed = np.zeros(len(table), dtype=bool)
+        else:
+            changed = ~added & (hashes != previous.row_hash[np.maximum(prev_idx, 0)])
+        crossed = ~added & ~changed & self._crossed_boundary(table.suspension_expiry, since, today)
+        dirty = np.flatnonzero(added | changed | crossed)
+
+        # Carry state forward, then re-evaluate only the dirty rows
+        state = prev_state.copy()
+        arrears = {}
+        if len(dirty):
+            audit = self.auditor.audit_bulk(table.take(dirty), today)
+            state[dirty] = audit_states(audit)
+            arrears = dict(zip(audit["uwi"], audit["arrears_magnitude"].tolist()))
+
+        AuditSnapshot(table.uwi, hashes, table.suspension_expiry, state, today).save(self.snapshot_path)
+        return self._diff_report(table.uwi, dirty, prev_state, state, arrears, removed_uwi, removed_state,
+                                 int(added.sum()), int(changed.sum()), int(crossed.sum()), since, today)
+
+    def _diff_report(self, uwi, dirty, prev_state, state, arrears, removed_uwi, removed_state,
+                     n_added, n_changed, n_crossed, since, today):
+        lapsed = (STATE_CONSENT_LAPSE, STATE_DECAY)
+        before, after = prev_state[dirty], state[dirty]
+        was_out = np.isin(before, lapsed)
+        is_out = np.isin(after, lapsed)
+
+        def entries(mask):
+            return [{"uwi": str(uwi[row]),
+                     "from": STATE_LABELS[prev_state[row]] if prev_state[row] >= 0 else None,
+                     "to": STATE_LABELS[state[row]],
+                     "arrears_magnitude": arrears.get(uwi[row], 0)} for row in dirty[mask]]
+
+        return {
+            "since": str(since),
+            "audit_date": str(today),
+            "wells_total": len(uwi),
+            "re_evaluated": len(dirty),
+            "added": n_added,
+            "changed": n_changed,
+            "boundary_crossed": n_crossed,
+            "newly_out_of_consent": entries(~was_out & is_out),
+            "cleared": entries(was_out & ~is_out),
+            "escalated": entries((before == STATE_CONSENT_LAPSE) & (after == STATE_DECAY)),
+            "removed": [{"uwi": str(u), "from": STATE_LABELS[s]} for u, s in zip(removed_uwi, removed_state)],
+            "out_of_consent_total": int(np.isin(state, lapsed).sum()),
+        }
@@ -0,0 +1,147 @@
+"""
+WELLTEGRA FORENSIC KERNEL: WELL_REGISTRY v1.0
+Compact, column-backed index over the nested basin audit tree (region -> asset -> riskProfile -> wells).
+Built once, upserted incrementally, queried with vectorized masks.
+"""
+
+import numpy as np
+
+# Compliance flags evaluated as column checks. Order defines the violation bit layout.
+VIOLATION_FLAGS = ("MISSING_SUSPENSION_EXPIRY", "MISSING_VERTICAL_DATUM")
+
+
+class _Categories:
+    """Interns string labels (region, asset, operator...) to small integer codes."""
+    def __init__(self):
+        self.labels = []
+        self.codes = {}
+
+    def code(self, label):
+        code = self.codes.get(label)
+        if code is None:
+            code = self.codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+
+class WellRegistry:
+    """
+    Array-backed well registry.
+    Each well occupies one row; scalar attributes used for hunting live in NumPy columns,
+    the original record dict is kept alongside for alert rendering.
+    """
+    def __init__(self, capacity=256):
+        self.size = 0
+        self.records = []
+        self.row_by_uwi = {}
+        self.regions = _Categories()
+        self.assets = _Categories()
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.region_code = np.zeros(capacity, dtype=np.int32)
+        self.asset_code = np.zeros(capacity, dtype=np.int32)
+        self.arrears_critical = np.zeros(capacity, dtype=bool)
+        self.arrears_days = np.zeros(capacity, dtype=np.int64)
+        self.has_expiry = np.zeros(capacity, dtype=bool)
+        self.has_datum = np.zeros(capacity, dtype=bool)
+
+    def _grow(self):
+        columns = ("region_code", "asset_code", "arrears_critical", "arrears_days", "has_expiry", "has_datum")
+        old = {name: getattr(self, name) for name in columns}
+        self._allocate(self.capacity * 2)
+        for name, values in old.items():
+            getattr(self, name)[:self.size] = values[:self.size]
+
+    @classmethod
+    def from_basin_data(cls, basin_data):
+        """Walks the basin tree once and loads every well."""
+        registry = cls()
+        for region in basin_data:
+            for asset in region['assets']:
+                for profile in asset['riskProfiles']:
+                    for well in profile['wells']:
+                        registry.upsert(well, region['region'], asset['type'])
+        return registry
+
+    def upsert(self, well, region, asset):
+        """Inserts a new well or overwrites the row of an existing UWI in place."""
+        row = self.row_by_uwi.get(well['uwi'])
+        if row is None:
+            if self.size == self.capacity:
+                self._grow()
+            row = self.size
+            self.size += 1
+            self.row_by_uwi[well['uwi']] = row
+            self.records.append(well)
+        else:
+            self.records[row] = well
+
+        self.region_code[row] = self.regions.code(region)
+        self.asset_code[row] = self.assets.code(asset)
+        self.arrears_critical[row] = bool(well.get('isArrearsCritical'))
+        self.arrears_days[row] = well.get('arrearsDays') or 0
+        self.has_expiry[row] = bool(well.get('suspensionExpiry'))
+        self.has_datum[row] = bool(well.get('verticalDatum'))
+        return row
+
+    def get(self, uwi):
+        row = self.row_by_uwi.get(uwi)
+        return None if row is None else self.records[row]
+
+    def _label_mask(self, categories, column, label):
+        code = categories.codes.get(label)
+        if code is None:
+            return np.zeros(self.size, dtype=bool)
+        return column[:self.size] == code
+
+    def region_mask(self, region):
+        return self._label_mask(self.regions, self.region_code, region)
+
+    def asset_mask(self, asset):
+        return self._label_mask(self.assets, self.asset_code, asset)
+
+    def arrears_mask(self):
+        return self.arrears_critical[:self.size].copy()
+
+    def rows(self, mask):
+        return np.flatnonzero(mask)
+
+    def violation_matrix(self, rows=None):
+        """
+        Evaluates every compliance flag as a column check.
+        Returns a (n_rows, len(VIOLATION_FLAGS)) boolean matrix.
+        """
+        if rows is None:
+            rows = slice(0, self.size)
+        return np.column_stack((~self.has_expiry[rows], ~self.has_datum[rows]))
+
+    def violation_codes(self, rows=None):
+        """Packs each row's violation flags into a bit code (bit i <=> VIOLATION_FLAGS[i])."""
+        matrix = self.violation_matrix(rows)
+        return matrix.astype(np.int64) @ (1 << np.arange(len(VIOLATION_FLAGS)))
+
+    def evaluate_compliance(self, rows=None):
+        """Vectorized equivalent of GhostWellHunter.evaluate_compliance for a set of rows."""
+        return [compliance_verdict(code) for code in self.violation_codes(rows)]
+
+    def labels(self, row):
+        """Region and asset labels for a row."""
+        return self.regions.labels[self.region_code[row]], self.assets.labels[self.asset_code[row]]
+
+
+_VERDICTS = {}
+
+
+def compliance_verdict(code):
+    """Compliance dict for a violation bit code. Only 2**len(VIOLATION_FLAGS) verdicts exist."""
+    verdict = _VERDICTS.get(code)
+    if verdict is None:
+        violations = tuple(flag for i, flag in enumerate(VIOLATION_FLAGS) if code & (1 << i))
+        verdict = _VERDICTS[code] = {
+            "is_compliant": not violations,
+            "violations": violations,
+            "risk_classification": "DATA_ABYSS" if violations else "NOMINAL"
+        }
+    return dict(verdict, violations=list(verdict["violations"]))
@@ -0,0 +1,31 @@
+"""
+Shared pytest setup: puts the loose kernel directories on sys.path the same way the
+scripts and benchmarks do, and gates slow load runs behind --run-slow.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, "core"), os.path.join(ROOT, "scripts")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--run-slow", action="store_true", help="Also run multi-second load tests")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: multi-second load test, skipped unless --run-slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip = pytest.mark.skip(reason="slow load test; pass --run-slow to include it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip)
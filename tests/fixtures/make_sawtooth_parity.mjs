@@ -0,0 +1,86 @@
+// Regenerates sawtooth_parity.json from the browser kernels in forensic_logic/math.ts:
+//   node tests/fixtures/make_sawtooth_parity.mjs
+// Uses the repo's `typescript` devDependency when installed; otherwise strips the
+// parameter/return annotations of math.ts's exported signatures, the only TS syntax it uses.
+
+import { readFileSync, writeFileSync } from "node:fs";
+import { dirname, join } from "node:path";
+import { fileURLToPath } from "node:url";
+
+const HERE = dirname(fileURLToPath(import.meta.url));
+const SOURCE = join(HERE, "..", "..", "forensic_logic", "math.ts");
+const TARGET = join(HERE, "sawtooth_parity.json");
+
+async function loadKernels() {
+  const ts = readFileSync(SOURCE, "utf8");
+  let js;
+  try {
+    const { default: typescript } = await import("typescript");
+    js = typescript.transpileModule(ts, { compilerOptions: { module: "ESNext", target: "ES2020" } }).outputText;
+  } catch {
+    js = ts.replace(/^(export function \w+\()(.*)\)\s*:.*\{\s*$/gm,
+      (_, head, params) => head + params.replace(/:\s*[\w[\]]+/g, "") + ") {");
+  }
+  return import("data:text/javascript;base64," + Buffer.from(js).toString("base64"));
+}
+
+// Deterministic noise so the fixture is stable across regenerations
+function mulberry32(seed) {
+  return () => {
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const rand = mulberry32(7);
+const noisy = Array.from({ length: 288 }, (_, i) => 1500 + 3.2 * i + 40 * Math.sin((2 * Math.PI * (i - 12)) / 144) + 10 * (rand() - 0.5));
+const thermal = Array.from({ length: 288 }, (_, i) => 60 + 8 * Math.sin((2 * Math.PI * i) / 144) + (rand() - 0.5));
+
+const SERIES = {
+  empty: [],
+  single: [1500],
+  pair: [1500, 1512.5],
+  constant: [1500, 1500, 1500, 1500, 1500],
+  ramp: [1500, 1505, 1510, 1515, 1520, 1525],
+  falling: [2000, 1990.5, 1981, 1971.5],
+  nan: [1500, NaN, 1510, 1515],
+  inf: [1500, Infinity, 1510, 1515],
+  tie: [3, 9, 1, 9, 2],
+  offset: [1e9, 1e9 + 1, 1e9 + 2, 1e9 + 4],
+  noisy,
+  thermal,
+};
+
+const PAIRS = [
+  ["empty", "empty"], ["single", "single"], ["pair", "pair"], ["constant", "ramp"],
+  ["ramp", "constant"], ["ramp", "falling"], ["ramp", "ramp"], ["falling", "ramp"],
+  ["nan", "ramp"], ["ramp", "nan"], ["nan", "nan"], ["inf", "ramp"], ["tie", "ramp"],
+  ["ramp", "tie"], ["noisy", "thermal"], ["ramp", "pair"],
+];
+
+const R_SQUARED = [NaN, 0, 0.5, 0.85, 0.86, 0.98, 0.99, 1];
+const SLOPES = [NaN, 0, -3, 2, 2.0625, 2.5, 5, 5.125, -15.005, 15, 20, 0.0005, Infinity, 1e21, 2.5e22];
+
+async function main() {
+  const math = await loadKernels();
+  const fixture = {
+    source: "forensic_logic/math.ts",
+    series: SERIES,
+    regression: Object.keys(SERIES).map((name) => ({ name, ...math.calculateLinearRegression(SERIES[name]) })),
+    pairs: PAIRS.map(([p, t]) => ({
+      p, t,
+      correlation: math.detectCyclicalCorrelation(SERIES[p], SERIES[t]),
+      lag: math.calculateThermalLag(SERIES[p], SERIES[t]),
+    })),
+    diagnose: R_SQUARED.flatMap((rSquared) => SLOPES.map((slope) => ({ rSquared, slope, ...math.diagnoseSawtooth(rSquared, slope) }))),
+  };
+  // JSON has no NaN/Infinity; emit the bare tokens Python's json module reads back as floats
+  const text = JSON.stringify(fixture, (_, v) => (typeof v === "number" && !Number.isFinite(v) ? `@@${v}@@` : v), 1)
+    .replace(/"@@(NaN|-?Infinity)@@"/g, "$1");
+  writeFileSync(TARGET, text + "\n");
+  console.log(`>>> PARITY_FIXTURE_WRITTEN: ${TARGET}`);
+}
+
+main();
@@ -0,0 +1,60 @@
+"""
+Parity of the fleet solver with the browser kernels it ports (forensic_logic/math.ts).
+Expected values come from tests/fixtures/sawtooth_parity.json, generated by running the
+TypeScript under node; regenerate with `node tests/fixtures/make_sawtooth_parity.mjs`.
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+import annulus_sawtooth_solver as solver
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "sawtooth_parity.json")
+
+with open(FIXTURE) as f:
+    PARITY = json.load(f)
+SERIES = PARITY["series"]
+
+
+def assert_same(actual, expected):
+    # Summation order differs between the JS loops and NumPy, so allow float noise
+    np.testing.assert_allclose(float(actual), expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize("case", PARITY["regression"], ids=lambda case: case["name"])
+def test_linear_regression_matches_ts(case):
+    slope, intercept, r_squared = solver.linear_regression_batch(SERIES[case["name"]])
+    assert_same(slope[0], case["slope"])
+    assert_same(intercept[0], case["intercept"])
+    assert_same(r_squared[0], case["rSquared"])
+
+
+@pytest.mark.parametrize("case", PARITY["pairs"], ids=lambda case: f"{case['p']}-{case['t']}")
+def test_cyclical_correlation_matches_ts(case):
+    r = solver.cyclical_correlation_batch(SERIES[case["p"]], SERIES[case["t"]])
+    assert_same(r[0], case["correlation"])
+
+
+@pytest.mark.parametrize("case", PARITY["pairs"], ids=lambda case: f"{case['p']}-{case['t']}")
+def test_thermal_lag_matches_ts(case):
+    lag = solver.thermal_lag_batch(SERIES[case["p"]], SERIES[case["t"]])
+    assert int(lag[0]) == case["lag"]
+
+
+def test_diagnose_sawtooth_matches_ts():
+    for case in PARITY["diagnose"]:
+        expected = {key: case[key] for key in ("status", "color", "diagnosis")}
+        assert solver.diagnose_sawtooth(case["rSquared"], case["slope"]) == expected, case
+
+
+def test_batches_match_ts_row_by_row():
+    # The same fixture rows stacked into one matrix: batching must not couple wells
+    names = ["falling", "nan", "inf", "offset"]
+    slope, intercept, r_squared = solver.linear_regression_batch(np.array([SERIES[n] for n in names]))
+    expected = {case["name"]: case for case in PARITY["regression"]}
+    for row, name in enumerate(names):
+        assert_same(slope[row], expected[name]["slope"])
+        assert_same(r_squared[row], expected[name]["rSquared"])
@@ -0,0 +1,53 @@
+"""
+Shared Earth-System rule table: bounds, malformed values and the single depth envelope.
+"""
+
+import numpy as np
+import pytest
+
+from constraint_engine import DEPTH_FIELDS, MAX_WELL_DEPTH, ConstraintEngine, default_engine
+
+
+def test_executor_artifacts_pass():
+    assert default_engine().validate({"status": "SUCCESS", "gr_max": 450, "depth_start": 8500, "depth_end": 12500}) == []
+    assert default_engine().validate({"zone": "Mungaroo_Sand", "gr_api": 45, "phi": 0.22}) == []
+
+
+@pytest.mark.parametrize("field", DEPTH_FIELDS)
+def test_every_depth_field_shares_one_envelope(field):
+    engine = default_engine()
+    assert engine.validate({field: MAX_WELL_DEPTH}) == []
+    assert engine.validate({field: MAX_WELL_DEPTH + 1}) == ["Depth violates lithospheric limit."]
+
+
+def test_shared_message_is_reported_once():
+    assert default_engine().validate({"depth": 50000, "depth_end": 50000}) == ["Depth violates lithospheric limit."]
+
+
+@pytest.mark.parametrize("value", ["50000", "deep", True, [50000]])
+def test_present_non_numeric_value_vetoes(value):
+    assert default_engine().validate({"depth": value}) == [
+        "Non-numeric depth cannot be checked against its physical envelope."]
+
+
+@pytest.mark.parametrize("artifact", [{}, {"depth": None}, {"depth": float("nan")}, {"note": "50000"}])
+def test_absent_values_are_out_of_scope(artifact):
+    assert default_engine().validate(artifact) == []
+
+
+def test_batch_counts_malformed_and_bound_violations():
+    report = default_engine().validate_batch(
+        [{"depth": "1"}, {"depth_end": 50000}, {"gr_max": 501, "gr_api": 600}, {"recovery_factor": 0.5}])
+    assert report.vetoed.tolist() == [True, True, True, False]
+    assert report.all_reasons()[3] == []
+    assert report.counts() == {
+        "Non-numeric depth cannot be checked against its physical envelope.": 1,
+        "Depth violates lithospheric limit.": 1,
+        "GR exceeds standard API calibration envelope.": 2,
+    }
+
+
+def test_validate_columns_keeps_nan_out_of_scope():
+    engine = ConstraintEngine([{"field": "x", "min": 0, "max": 1, "veto": "x out of range"}])
+    report = engine.validate_columns({"x": np.array([0.5, np.nan, 2.0, -1.0])})
+    assert report.vetoed.tolist() == [False, False, True, True]
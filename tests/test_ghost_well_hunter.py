@@ -0,0 +1,44 @@
+"""
+GhostWellHunter registry handling: a basin tree is re-indexed on every hunt, while a
+caller-held WellRegistry is the explicit, upsert-driven fast path.
+"""
+
+from ghost_well_hunter import GhostWellHunter
+from well_registry import WellRegistry
+
+
+def _well(uwi, critical=True, expiry=None, datum="MSL"):
+    return {"uwi": uwi, "status": "Suspended", "isArrearsCritical": critical, "arrearsDays": 400,
+            "suspensionExpiry": expiry, "verticalDatum": datum}
+
+
+def _basin(*wells):
+    return [{"region": "Northern North Sea",
+             "assets": [{"type": "Subsea Ghost", "riskProfiles": [{"profile": "ARREARS_CRITICAL", "wells": list(wells)}]}]}]
+
+
+def _uwis(records):
+    return sorted(record["uwi"] for record in records)
+
+
+def test_in_place_edits_to_the_tree_are_seen_by_a_reused_hunter():
+    hunter = GhostWellHunter()
+    basin = _basin(_well("211/18-A1"), _well("211/18-A2"))
+    assert _uwis(hunter.stream_alerts(basin)) == ["211/18-A1", "211/18-A2"]
+
+    wells = basin[0]["assets"][0]["riskProfiles"][0]["wells"]
+    wells.append(_well("211/18-A3"))
+    wells[0]["isArrearsCritical"] = False
+    assert _uwis(hunter.stream_alerts(basin)) == ["211/18-A2", "211/18-A3"]
+    assert len(hunter.run_mission(basin)) == 2
+
+
+def test_prebuilt_registry_follows_upserts_only():
+    hunter = GhostWellHunter()
+    basin = _basin(_well("211/18-A1"), _well("211/18-A2"))
+    registry = WellRegistry.from_basin_data(basin)
+
+    registry.upsert(_well("211/18-A9"), "Northern North Sea", "Subsea Ghost")
+    registry.upsert(_well("211/18-A1", critical=False), "Northern North Sea", "Subsea Ghost")
+    assert _uwis(hunter.stream_alerts(registry=registry)) == ["211/18-A2", "211/18-A9"]
+    assert len(hunter.run_mission(registry=registry)) == 2
@@ -0,0 +1,57 @@
+"""
+MissionVault resume semantics: journal-driven restores, per-orchestrator mission ids and
+artifact ages that are not refreshed by restores on the concurrent paths.
+"""
+
+import pytest
+
+import multi_agent_audit
+import multi_agent_framework
+from mission_vault import MissionVault, mission_id
+
+GOAL = "Identify untapped reserves in the Thistle Field via Datum Alignment"
+
+ORCHESTRATORS = [
+    (multi_agent_audit, "run_concurrent"),
+    (multi_agent_framework, "run_mission_concurrent"),
+]
+
+
+@pytest.fixture(autouse=True)
+def no_simulated_latency(monkeypatch):
+    for module in (multi_agent_audit, multi_agent_framework):
+        monkeypatch.setattr(module.time, "sleep", lambda seconds: None)
+
+
+@pytest.fixture
+def vault(tmp_path):
+    vault = MissionVault(str(tmp_path / "mission_vault.db"), max_age_s=3600)
+    yield vault
+    vault.close()
+
+
+def _created(vault):
+    return vault.db.execute("SELECT key, created FROM artifacts ORDER BY key").fetchall()
+
+
+@pytest.mark.parametrize("module, run", ORCHESTRATORS)
+def test_concurrent_restore_does_not_reset_artifact_age(vault, module, run, capsys):
+    getattr(module.AuditOrchestrator(vault), run)(GOAL)
+    first = _created(vault)
+    capsys.readouterr()
+
+    getattr(module.AuditOrchestrator(vault), run)(GOAL)
+    out = capsys.readouterr().out
+    assert _created(vault) == first
+    assert "COMMITTED_TO_VAULT" not in out
+    assert out.count("RESTORED") == 4
+
+
+def test_orchestrators_keep_separate_journals(vault):
+    multi_agent_audit.AuditOrchestrator(vault).run(GOAL)
+    assert vault.journal(mission_id(multi_agent_framework.AuditOrchestrator.VAULT_NAMESPACE, GOAL)) == {}
+    # The framework mission must execute its own tasks, not restore the audit's T1..T4
+    multi_agent_framework.AuditOrchestrator(vault).run_mission(GOAL)
+    journal = vault.journal(mission_id(multi_agent_framework.AuditOrchestrator.VAULT_NAMESPACE, GOAL))
+    assert set(journal) == {"T1", "T2", "T3", "T4"}
+    assert vault.journal(mission_id(multi_agent_audit.AuditOrchestrator.VAULT_NAMESPACE, GOAL))["T1"] == "VERIFIED"